@@ -1,5 +1,6 @@
 """Abstract generation endpoint — Phase 1."""
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, HTTPException, Depends
@@ -32,7 +33,11 @@ router = APIRouter(prefix="/abstract", tags=["abstract"])
 # ─── Progress emitter ─────────────────────────────────────────────────────────
 
 async def _emit(user_id: str, step: str, status: str, **data):
-    """Push a processing_update event to the user's active WebSocket."""
+    """Push a processing_update event to the user's active WebSocket.
+
+    "done" events carry the step's output in ``result`` so the client can
+    render each section as soon as it is ready, before the HTTP response.
+    """
     try:
         await ws_manager.broadcast_to_user(user_id, {
             "type": "processing_update",
@@ -52,9 +57,10 @@ _NOVELTY_COMMENTARY_SYSTEM = (
 )
 
 def _build_novelty_commentary_prompt(count: int, papers: list, blueprint) -> str:
-    papers_text = ""
-    for i, p in enumerate(papers[:3], 1):
-        papers_text += f"{i}. {p.get('authors', '')} ({p.get('year', '')}) — \"{p.get('title', '')}\" — {p.get('journal', '')}\n"
+    papers_text = "".join(
+        f"{i}. {p.get('authors', '')} ({p.get('year', '')}) — \"{p.get('title', '')}\" — {p.get('journal', '')}\n"
+        for i, p in enumerate(papers[:3], 1)
+    )
 
     return (
         f"PubMed search cho nghiên cứu về '{blueprint.intervention_or_exposure}' "
@@ -70,8 +76,35 @@ def _build_novelty_commentary_prompt(count: int, papers: list, blueprint) -> str
     )
 
 
+def _template_novelty_commentary(count: int) -> str:
+    """Rule-based commentary, keyed on how crowded the topic is."""
+    if count < 5:
+        return (
+            "Chủ đề này chưa có nhiều nghiên cứu — cơ hội tốt để đóng góp. "
+            "Nhiều journal chào đón nghiên cứu đầu tiên từ population của bạn."
+        )
+    elif count < 30:
+        return (
+            f"Đã có ~{count} bài tương tự. "
+            "Cần làm rõ điểm khác biệt (population, setting, hoặc outcome) trong Introduction. "
+            "Nhiều journal vẫn nhận replication study từ population khác."
+        )
+    else:
+        return (
+            f"Chủ đề đã được nghiên cứu nhiều (~{count} bài). "
+            "Để tăng tính mới: focus vào population Việt Nam, thêm secondary outcome chưa ai đo, "
+            "hoặc thu hẹp subgroup cụ thể. "
+            "Nhiều journal vẫn nhận replication study từ population khác nếu address novelty rõ trong Introduction."
+        )
+
+
 async def _generate_novelty_commentary(count: int, papers: list, blueprint, llm, user_id: str = None) -> str:
     """Generate a short novelty commentary using LLM (light call, ~200 tokens)."""
+    # No similar papers: there is nothing for the LLM to compare against,
+    # and the template already says everything useful.
+    if not papers:
+        return _template_novelty_commentary(count)
+
     try:
         prompt = _build_novelty_commentary_prompt(count, papers, blueprint)
         response = await llm.complete(
@@ -83,25 +116,60 @@ async def _generate_novelty_commentary(count: int, papers: list, blueprint, llm,
         )
         return response.content.strip()
     except Exception:
-        # Fallback template commentary
-        if count < 5:
-            return (
-                "Chủ đề này chưa có nhiều nghiên cứu — cơ hội tốt để đóng góp. "
-                "Nhiều journal chào đón nghiên cứu đầu tiên từ population của bạn."
-            )
-        elif count < 30:
-            return (
-                f"Đã có ~{count} bài tương tự. "
-                "Cần làm rõ điểm khác biệt (population, setting, hoặc outcome) trong Introduction. "
-                "Nhiều journal vẫn nhận replication study từ population khác."
-            )
-        else:
-            return (
-                f"Chủ đề đã được nghiên cứu nhiều (~{count} bài). "
-                "Để tăng tính mới: focus vào population Việt Nam, thêm secondary outcome chưa ai đo, "
-                "hoặc thu hẹp subgroup cụ thể. "
-                "Nhiều journal vẫn nhận replication study từ population khác nếu address novelty rõ trong Introduction."
+        return _template_novelty_commentary(count)
+
+
+# ─── Novelty check ────────────────────────────────────────────────────────────
+
+async def _run_novelty_check(blueprint, llm, user_id: str) -> NoveltyCheck | None:
+    """PubMed novelty check. Non-critical: returns None on any failure."""
+    try:
+        query = await build_pubmed_query(blueprint, llm)
+        logger.info("[ABSTRACT] PubMed search query: %s", query)
+        await _emit(user_id, "pubmed", "running", query=query)
+
+        pubmed_result = await search_pubmed(query, max_results=5)
+        raw_papers = pubmed_result.get("papers", [])
+        query_used = pubmed_result.get("query_used", query)
+        logger.info("[ABSTRACT] PubMed result: count=%s  papers=%d",
+                    pubmed_result.get("count"), len(raw_papers))
+
+        papers = [
+            NoveltyPaper(
+                title=p["title"],
+                authors=p["authors"],
+                year=p["year"],
+                journal=p["journal"],
+                pmid=p.get("pmid"),
             )
+            for p in raw_papers
+        ]
+
+        commentary = await _generate_novelty_commentary(
+            count=pubmed_result["count"],
+            papers=raw_papers,
+            blueprint=blueprint,
+            llm=llm,
+            user_id=user_id,
+        )
+        logger.info("[ABSTRACT] Novelty commentary: %r", commentary[:100])
+
+        novelty_check = NoveltyCheck(
+            count=pubmed_result["count"],
+            papers=papers,
+            commentary=commentary,
+            keywords_used=[query_used],
+        )
+        await _emit(user_id, "pubmed", "done",
+                    count=pubmed_result["count"],
+                    papers=len(papers),
+                    query=query_used,
+                    result=novelty_check.model_dump(mode="json"))
+        return novelty_check
+    except Exception as e:
+        await _emit(user_id, "pubmed", "error", message=str(e))
+        logger.warning("[ABSTRACT] Novelty check failed (non-critical): %s", e)
+        return None
 
 
 # ─── Endpoint ─────────────────────────────────────────────────────────────────
@@ -157,7 +225,22 @@ async def generate_abstract(
     logger.info("[ABSTRACT] Starting generation for session=%s  design=%s  population=%r",
                 request.session_id, blueprint.design_type, blueprint.population)
 
-    # ── 1. Generate abstract ──────────────────────────────────────────────────
+    # ── 1+2. Abstract and PubMed novelty check ────────────────────────────────
+    # The novelty check only needs the blueprint, so its LLM/PubMed round
+    # trips run alongside abstract generation instead of after it.
+    novelty_task = asyncio.create_task(_run_novelty_check(blueprint, llm, user_id))
+    # Journal search is blueprint-only too; its embedding + vector query is
+    # blocking, so it runs in a worker thread during the LLM calls.
+    search_query = (
+        f"{blueprint.population} {blueprint.primary_outcome} "
+        f"{blueprint.intervention_or_exposure}"
+    )
+    journals_task = asyncio.create_task(asyncio.to_thread(
+        search_journals,
+        query=search_query,
+        specialty=blueprint.specialty,
+        top_k=5,
+    ))
     try:
         await _emit(user_id, "abstract", "running")
         prompt = get_abstract_generation_prompt(blueprint)
@@ -179,73 +262,25 @@ async def generate_abstract(
             warning_text = "\n\n[Cảnh báo tự động: " + "; ".join(issues) + "]"
             estimated_abstract += warning_text
 
-        await _emit(user_id, "abstract", "done", chars=len(estimated_abstract))
+        await _emit(user_id, "abstract", "done", chars=len(estimated_abstract),
+                    result=estimated_abstract)
 
     except Exception as e:
         await _emit(user_id, "abstract", "error", message=str(e))
         logger.exception("[ABSTRACT] Failed to generate abstract for session=%s", request.session_id)
+        novelty_task.cancel()
+        journals_task.cancel()
         raise HTTPException(status_code=500, detail=f"Failed to generate abstract: {str(e)}")
 
-    # ── 2. PubMed novelty check ───────────────────────────────────────────────
-    novelty_check: NoveltyCheck | None = None
-    try:
-        query = await build_pubmed_query(blueprint, llm)
-        logger.info("[ABSTRACT] PubMed search query: %s", query)
-        await _emit(user_id, "pubmed", "running", query=query)
-
-        pubmed_result = await search_pubmed(query, max_results=5)
-        logger.info("[ABSTRACT] PubMed result: count=%s  papers=%d",
-                    pubmed_result.get("count"), len(pubmed_result.get("papers", [])))
-
-        papers = [
-            NoveltyPaper(
-                title=p["title"],
-                authors=p["authors"],
-                year=p["year"],
-                journal=p["journal"],
-                pmid=p.get("pmid"),
-            )
-            for p in pubmed_result.get("papers", [])
-        ]
-
-        commentary = await _generate_novelty_commentary(
-            count=pubmed_result["count"],
-            papers=pubmed_result.get("papers", []),
-            blueprint=blueprint,
-            llm=llm,
-            user_id=user_id,
-        )
-        logger.info("[ABSTRACT] Novelty commentary: %r", commentary[:100])
-
-        novelty_check = NoveltyCheck(
-            count=pubmed_result["count"],
-            papers=papers,
-            commentary=commentary,
-            keywords_used=[pubmed_result.get("query_used", query)],
-        )
-        await _emit(user_id, "pubmed", "done",
-                    count=pubmed_result["count"],
-                    papers=len(papers),
-                    query=pubmed_result.get("query_used", query))
-    except Exception as e:
-        await _emit(user_id, "pubmed", "error", message=str(e))
-        logger.warning("[ABSTRACT] Novelty check failed (non-critical): %s", e)
+    novelty_check = await novelty_task
 
     # ── 3. Journal suggestions ────────────────────────────────────────────────
     journal_suggestions: list[JournalSuggestion] = []
     try:
-        search_query = (
-            f"{blueprint.population} {blueprint.primary_outcome} "
-            f"{blueprint.intervention_or_exposure}"
-        )
         logger.info("[ABSTRACT] Journal search query: %r", search_query[:100])
         await _emit(user_id, "journals", "running", query=search_query[:80])
 
-        journals = search_journals(
-            query=search_query,
-            specialty=blueprint.specialty,
-            top_k=5,
-        )
+        journals = await journals_task
         logger.info("[ABSTRACT] Journals found: %d", len(journals))
         journal_suggestions = [
             JournalSuggestion(
@@ -262,7 +297,8 @@ async def generate_abstract(
             )
             for j in journals
         ]
-        await _emit(user_id, "journals", "done", count=len(journal_suggestions))
+        await _emit(user_id, "journals", "done", count=len(journal_suggestions),
+                    result=[j.model_dump(mode="json") for j in journal_suggestions])
     except Exception as e:
         await _emit(user_id, "journals", "error", message=str(e))
         logger.warning("[ABSTRACT] Journal search failed (non-critical): %s", e)
@@ -275,7 +311,8 @@ async def generate_abstract(
                     roadmap.design_type if roadmap else None,
                     len(roadmap.steps) if roadmap else 0)
         await _emit(user_id, "roadmap", "done",
-                    steps=len(roadmap.steps) if roadmap else 0)
+                    steps=len(roadmap.steps) if roadmap else 0,
+                    result=roadmap.model_dump(mode="json") if roadmap else None)
     except Exception as e:
         await _emit(user_id, "roadmap", "error", message=str(e))
         logger.warning("[ABSTRACT] Roadmap generation failed (non-critical): %s", e)
@@ -4,6 +4,7 @@ import io
 import logging
 from datetime import datetime
 
+import orjson
 from fastapi import APIRouter, HTTPException, Depends, Query
 from fastapi.responses import StreamingResponse
 
@@ -519,8 +520,7 @@ async def export_manuscript_outline(
         raise HTTPException(status_code=400, detail="Outline not yet generated. Complete Phase 3 first.")
 
     try:
-        import json
-        outline_data = json.loads(outline_raw)
+        outline_data = orjson.loads(outline_raw)
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="Outline data is invalid. Please regenerate the outline.")
 
@@ -1,5 +1,8 @@
 """Submission gate endpoint (Phase 2)."""
 
+import asyncio
+from datetime import datetime
+
 from fastapi import APIRouter, HTTPException, Depends
 
 from app.core.supabase_client import supabase_service
@@ -91,39 +94,31 @@ async def run_gate_check(
         for v in gate_result.violations
     ]
 
-    # Save violations to database
+    # Save violations and generate the reviewer simulation concurrently —
+    # the reviewer prompt only needs the in-memory gate result.
     gate_run_count = session.get("gate_run_count", 0) + 1
-    await supabase_service.save_violations(
-        session_id=request.session_id,
-        violations=[v.model_dump() for v in violations],
-        gate_run_number=gate_run_count,
-    )
-
-    # Generate reviewer simulation
-    reviewer_sim = None
-    try:
-        llm = get_llm_client()
-        prompt = get_reviewer_simulation_prompt(
-            violations=violations,
-            gate_result=gate_result.gate_result,
-            integrity_score=gate_result.integrity_score,
-            gate_run_count=gate_run_count,
-        )
-
-        response = await llm.complete(
-            prompt=prompt,
-            system_prompt=SYSTEM_PROMPT,
-            temperature=0.7,
-            max_tokens=1000,
-            user_id=user_id,
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(supabase_service.save_violations(
+            session_id=request.session_id,
+            violations=[v.model_dump() for v in violations],
+            gate_run_number=gate_run_count,
+        ))
+        reviewer_task = tg.create_task(
+            _simulate_reviewer(violations, gate_result, gate_run_count, user_id)
         )
-        reviewer_sim = response.content.strip()
-
-    except Exception as e:
-        # Fallback to quick feedback
-        reviewer_sim = get_quick_feedback(violations, gate_result.gate_result)
-
-    # Update session
+    reviewer_sim = reviewer_task.result()
+
+    # Update session, folding the score history and abstract version appends
+    # into the same write. Re-read the row first: the reviewer call takes
+    # seconds, and /abstract/generate may have appended a version meanwhile.
+    latest = await supabase_service.get_research_session(request.session_id) or session
+    score_history = (latest.get("score_history") or []) + [gate_result.integrity_score]
+    abstract_versions = latest.get("abstract_versions") or []
+    abstract_versions = abstract_versions + [{
+        "version": len(abstract_versions) + 1,
+        "abstract": request.abstract,
+        "timestamp": datetime.utcnow().isoformat(),
+    }]
     await supabase_service.update_research_session(
         request.session_id,
         {
@@ -132,27 +127,13 @@ async def run_gate_check(
             "integrity_score": gate_result.integrity_score,
             "gate_result": gate_result.gate_result.value,
             "reviewer_simulation": reviewer_sim,
-            "gate_run_count": gate_run_count,
+            "gate_run_count": len(score_history),
+            "score_history": score_history,
+            "abstract_versions": abstract_versions,
             "status": SessionStatus.GATE_RUN.value,
         }
     )
 
-    # Append to score history
-    await supabase_service.append_score_history(
-        request.session_id,
-        gate_result.integrity_score,
-    )
-
-    # Append abstract version
-    await supabase_service.append_abstract_version(
-        request.session_id,
-        request.abstract,
-    )
-
-    # Get updated score history
-    updated_session = await supabase_service.get_research_session(request.session_id)
-    score_history = updated_session.get("score_history", [])
-
     return GateRunResponse(
         session_id=request.session_id,
         gate_result=gate_result.gate_result,
@@ -163,3 +144,27 @@ async def run_gate_check(
         score_history=score_history,
         can_proceed_to_phase3=can_proceed_to_outline(gate_result.gate_result),
     )
+
+
+async def _simulate_reviewer(violations, gate_result, gate_run_count: int, user_id: str) -> str:
+    """Generate reviewer simulation, falling back to rule-based quick feedback."""
+    try:
+        llm = get_llm_client()
+        prompt = get_reviewer_simulation_prompt(
+            violations=violations,
+            gate_result=gate_result.gate_result,
+            integrity_score=gate_result.integrity_score,
+            gate_run_count=gate_run_count,
+        )
+
+        response = await llm.complete(
+            prompt=prompt,
+            system_prompt=SYSTEM_PROMPT,
+            temperature=0.7,
+            max_tokens=1000,
+            user_id=user_id,
+        )
+        return response.content.strip()
+
+    except Exception:
+        return get_quick_feedback(violations, gate_result.gate_result)
@@ -1,5 +1,6 @@
 """Manuscript outline endpoint (Phase 3)."""
 
+import orjson
 from fastapi import APIRouter, HTTPException, Depends
 
 from app.core.supabase_client import supabase_service
@@ -192,9 +193,8 @@ async def generate_outline(
     )
 
     # Store full structured response as JSON for frontend retrieval
-    import json
     from app.models.enums import Phase
-    outline_json = json.dumps(response.model_dump(), default=str)
+    outline_json = orjson.dumps(response.model_dump(), default=str).decode()
 
     # Update session — advance phase to phase3
     await supabase_service.update_research_session(
@@ -1,6 +1,8 @@
 """Session management endpoints."""
 
+from datetime import datetime
 from typing import Optional
+from uuid import UUID
 from fastapi import APIRouter, HTTPException, Depends
 
 from app.core.supabase_client import supabase_service
@@ -116,15 +118,29 @@ async def list_sessions(
     status: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
+    after_updated_at: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
     user_id: str = Depends(get_current_user_id),
 ):
-    """List user's sessions."""
+    """List user's sessions.
+
+    For the next page, pass the updated_at and id of the last item received as
+    after_updated_at/after_id (preferred over offset). A cursor cannot be
+    combined with offset, and after_id requires after_updated_at.
+    """
+    if after_id is not None and after_updated_at is None:
+        raise HTTPException(status_code=422, detail="after_id requires after_updated_at")
+    if after_updated_at is not None and offset:
+        raise HTTPException(status_code=422, detail="offset cannot be combined with a cursor")
+
     sessions = await supabase_service.get_user_sessions(
         user_id=user_id,
         phase=phase,
         status=status,
         limit=limit,
         offset=offset,
+        after_updated_at=after_updated_at,
+        after_id=after_id,
     )
 
     return [
@@ -171,14 +187,12 @@ async def advance_session_phase(
             detail="Phase 2 requires a paid subscription"
         )
 
-    await supabase_service.update_research_session(
+    updated = await supabase_service.update_research_session(
         session_id,
         {"phase": Phase.PHASE2.value}
     )
-
-    updated = await supabase_service.get_research_session(session_id)
     if not updated:
-        raise HTTPException(status_code=500, detail="Failed to fetch updated session")
+        raise HTTPException(status_code=404, detail="Session not found")
 
     return _session_to_response(updated)
 
@@ -200,14 +214,12 @@ async def revert_session_phase(
     if session.get("phase") != Phase.PHASE2.value:
         raise HTTPException(status_code=400, detail="Session must be in phase2 to revert")
 
-    await supabase_service.update_research_session(
+    updated = await supabase_service.update_research_session(
         session_id,
         {"phase": Phase.PHASE1.value}
     )
-
-    updated = await supabase_service.get_research_session(session_id)
     if not updated:
-        raise HTTPException(status_code=500, detail="Failed to fetch updated session")
+        raise HTTPException(status_code=404, detail="Session not found")
 
     return _session_to_response(updated)
 
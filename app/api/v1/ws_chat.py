@@ -1,8 +1,13 @@
 """WebSocket chat endpoint for real-time conversation."""
 
+import asyncio
 import json
 import logging
+import re
+import time
 from typing import Optional
+
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from app.core.supabase_client import supabase_service
@@ -13,6 +18,7 @@ from app.domain.blueprint.conversation import (
     format_blocking_message,
 )
 from app.domain.blueprint.blueprint_builder import build_blueprint
+from app.domain.search.pubmed_search import build_pubmed_query
 from app.core.ws_manager import ws_manager
 from app.models.schemas import ExtractedAttributes
 from app.models.enums import ConversationState, SessionStatus, DesignType
@@ -28,6 +34,57 @@ router = APIRouter(tags=["websocket"])
 DEFAULT_USER_ID = "53262502-c85d-436f-98eb-66f518383813"  # admin@avr.com
 DEV_MODE = False
 
+# Minimum interval between streamed clarification chunks; LLM token deltas
+# arriving faster than this are coalesced into one WebSocket frame.
+STREAM_FLUSH_INTERVAL = 0.05
+
+_MESSAGE_FIELD_RE = re.compile(r'"message"\s*:\s*"')
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: set[asyncio.Task] = set()
+
+# Static form labels/descriptions used when the LLM form is unavailable or
+# skips a missing element. Built once at import, not per message.
+_FALLBACK_LABELS = {
+    "population": "Đối tượng nghiên cứu", "sample_size": "Cỡ mẫu", "primary_endpoint": "Kết cục chính",
+    "intervention": "Can thiệp", "comparator": "Nhóm chứng", "exposure": "Phơi nhiễm",
+    "follow_up_duration": "Thời gian theo dõi", "reference_standard": "Tiêu chuẩn vàng",
+    "search_strategy": "Chiến lược tìm kiếm", "databases": "Cơ sở dữ liệu", "case_definition": "Định nghĩa ca bệnh",
+    "control_definition": "Định nghĩa nhóm chứng", "matching_criteria": "Tiêu chí ghép cặp",
+    "inclusion_criteria": "Tiêu chuẩn chọn", "exclusion_criteria": "Tiêu chuẩn loại",
+    "randomization_method": "Phương pháp ngẫu nhiên", "blinding": "Làm mù",
+}
+_FALLBACK_DESC = {
+    "population": "Đối tượng bạn cần nghiên cứu là gì? (Ví dụ: Trẻ em từ bao nhiêu tuổi, người lớn từ bao nhiêu tuổi, có phân biệt giới tính hay mắc bệnh nền không...)",
+    "sample_size": "Cỡ mẫu dự kiến bao nhiêu bệnh nhân? (Ví dụ: Khoảng 100-200 bệnh nhân, hoặc lấy mẫu toàn bộ dự kiến được 50 ca...)",
+    "primary_endpoint": "Kết cục chính để đánh giá là gì? (Ví dụ: Tỷ lệ tử vong sau 30 ngày, mức độ giảm đau sau 1 giờ, thời gian nằm viện...)",
+    "intervention": "Can thiệp hoặc phương pháp điều trị bạn áp dụng là gì? (Ví dụ: Dùng thuốc A liều lượng B, hoặc phẫu thuật thủ thuật C...)",
+    "comparator": "Nhóm chứng để đánh giá so sánh là gì? (Ví dụ: Phác đồ chuẩn, dùng thuốc giả dược (Placebo), hay không can thiệp...)",
+    "exposure": "Nhóm yếu tố nguy cơ/phơi nhiễm bạn muốn đánh giá là gì? (Ví dụ: Tiếp xúc khói thuốc, làm việc ở hầm mỏ...)",
+    "follow_up_duration": "Bạn dự kiến thời gian theo dõi bệnh nhân là bao lâu? (Ví dụ: Theo dõi 6 tháng, 1 năm, hoặc đến khi xuất viện...)",
+    "reference_standard": "Tiêu chuẩn vàng để đem ra so sánh với Test của bạn là gì? (Ví dụ: Kết quả giải phẫu bệnh, PCR...)",
+    "search_strategy": "Chiến lược tìm kiếm tài liệu của bạn là gì? Có từ khóa (Keywords) cụ thể nào không?",
+    "databases": "Bạn dự kiến sẽ lục tìm tài liệu trên nền tảng cơ sở dữ liệu nào? (Ví dụ: PubMed, Embase, Cochrane...)",
+    "case_definition": "Định nghĩa chính xác như thế nào thì được tính là 'ca bệnh' trong đề cương của bạn?",
+    "control_definition": "Định nghĩa như thế nào thì được gọi là 'nhóm chứng' (ng khỏe/ko mắc bệnh) trong đề cương của bạn?",
+    "matching_criteria": "Nếu bạn có ý định ghép cặp, bạn tính ghép theo tiêu chí nào? (Ví dụ: Cứ 1 bệnh nhân thì ghép 1 người khỏe có cùng tuổi và giới tính...)",
+    "inclusion_criteria": "Đâu là những tiêu chuẩn chọn chính để đưa bệnh nhân vào nghiên cứu?",
+    "exclusion_criteria": "Trường hợp nào dù thỏa mãn tiêu chuẩn chọn nhưng bạn sẽ chủ động loại trừ khỏi nghiên cứu?",
+    "randomization_method": "Chiến lược phân bổ ngẫu nhiên bạn hướng đến là gì? (Ví dụ: Simple, Blocked, máy tính...)",
+    "blinding": "Dự kiến thiết kế làm mù như thế nào? (Ví dụ: Mù đơn - bệnh nhân không biết, mù đôi - cả BS lẫn BN đều không biết...)",
+}
+
+
+def _fallback_form_field(attr: str) -> dict:
+    """Build the static form field for a missing attribute."""
+    return {
+        "attribute_name": attr,
+        "question_label": _FALLBACK_LABELS.get(attr, attr.replace("_", " ").title()),
+        "description": _FALLBACK_DESC.get(attr, "Hãy mô tả chi tiết thông tin cho phần này."),
+        "placeholder": "",
+    }
+
+
 # In-memory per-field attempt tracking: session_id -> {field_name -> attempt_count}
 # Cleared when session reaches COMPLETE or BLOCKED state.
 _field_attempt_counts: dict[str, dict[str, int]] = {}
@@ -45,6 +102,8 @@ async def websocket_chat(websocket: WebSocket):
     4. Client sends: {"type": "start_session", "session_id": "..."} or {"type": "create_session"}
     5. Client sends: {"type": "chat", "message": "..."}
     6. Server streams: {"type": "stream", "content": "...", "done": false}
+       A frame with "replace": true carries the full message text and replaces
+       everything streamed so far in this turn (sent if a streamed reply fails).
     7. Server sends final: {"type": "stream", "content": "", "done": true, "state": "...", "blueprint": {...}}
     """
     client = websocket.client
@@ -70,8 +129,8 @@ async def websocket_chat(websocket: WebSocket):
             data = await websocket.receive_text()
 
             try:
-                message = json.loads(data)
-            except json.JSONDecodeError as e:
+                message = orjson.loads(data)
+            except orjson.JSONDecodeError as e:
                 logger.warning("Invalid JSON from client: %s | raw=%r", e, data[:200])
                 await _send_error(websocket, "Invalid JSON")
                 continue
@@ -121,6 +180,9 @@ async def websocket_chat(websocket: WebSocket):
                     user_id=user_id,
                     phase=phase,
                 )
+                if not session:
+                    await _send_error(websocket, "Failed to create session")
+                    continue
                 session_id = session["id"]
                 logger.info("Session created: session_id=%s", session_id)
 
@@ -173,42 +235,7 @@ async def websocket_chat(websocket: WebSocket):
                 # Prepare dynamic form for initial state if needed
                 dynamic_form = []
                 if completeness.missing_elements:
-                    # A static dictionary for better fallback UI
-                    FALLBACK_LABELS = {
-                        "population": "Đối tượng nghiên cứu", "sample_size": "Cỡ mẫu", "primary_endpoint": "Kết cục chính",
-                        "intervention": "Can thiệp", "comparator": "Nhóm chứng", "exposure": "Phơi nhiễm",
-                        "follow_up_duration": "Thời gian theo dõi", "reference_standard": "Tiêu chuẩn vàng",
-                        "search_strategy": "Chiến lược tìm kiếm", "databases": "Cơ sở dữ liệu", "case_definition": "Định nghĩa ca bệnh",
-                        "control_definition": "Định nghĩa nhóm chứng", "matching_criteria": "Tiêu chí ghép cặp",
-                        "inclusion_criteria": "Tiêu chuẩn chọn", "exclusion_criteria": "Tiêu chuẩn loại",
-                        "randomization_method": "Phương pháp ngẫu nhiên", "blinding": "Làm mù",
-                    }
-                    FALLBACK_DESC = {
-                        "population": "Đối tượng bạn cần nghiên cứu là gì? (Ví dụ: Trẻ em từ bao nhiêu tuổi, người lớn từ bao nhiêu tuổi, có phân biệt giới tính hay mắc bệnh nền không...)",
-                        "sample_size": "Cỡ mẫu dự kiến bao nhiêu bệnh nhân? (Ví dụ: Khoảng 100-200 bệnh nhân, hoặc lấy mẫu toàn bộ dự kiến được 50 ca...)",
-                        "primary_endpoint": "Kết cục chính để đánh giá là gì? (Ví dụ: Tỷ lệ tử vong sau 30 ngày, mức độ giảm đau sau 1 giờ, thời gian nằm viện...)",
-                        "intervention": "Can thiệp hoặc phương pháp điều trị bạn áp dụng là gì? (Ví dụ: Dùng thuốc A liều lượng B, hoặc phẫu thuật thủ thuật C...)",
-                        "comparator": "Nhóm chứng để đánh giá so sánh là gì? (Ví dụ: Phác đồ chuẩn, dùng thuốc giả dược (Placebo), hay không can thiệp...)",
-                        "exposure": "Nhóm yếu tố nguy cơ/phơi nhiễm bạn muốn đánh giá là gì? (Ví dụ: Tiếp xúc khói thuốc, làm việc ở hầm mỏ...)",
-                        "follow_up_duration": "Bạn dự kiến thời gian theo dõi bệnh nhân là bao lâu? (Ví dụ: Theo dõi 6 tháng, 1 năm, hoặc đến khi xuất viện...)",
-                        "reference_standard": "Tiêu chuẩn vàng để đem ra so sánh với Test của bạn là gì? (Ví dụ: Kết quả giải phẫu bệnh, PCR...)",
-                        "search_strategy": "Chiến lược tìm kiếm tài liệu của bạn là gì? Có từ khóa (Keywords) cụ thể nào không?",
-                        "databases": "Bạn dự kiến sẽ lục tìm tài liệu trên nền tảng cơ sở dữ liệu nào? (Ví dụ: PubMed, Embase, Cochrane...)",
-                        "case_definition": "Định nghĩa chính xác như thế nào thì được tính là 'ca bệnh' trong đề cương của bạn?",
-                        "control_definition": "Định nghĩa như thế nào thì được gọi là 'nhóm chứng' (ng khỏe/ko mắc bệnh) trong đề cương của bạn?",
-                        "matching_criteria": "Nếu bạn có ý định ghép cặp, bạn tính ghép theo tiêu chí nào? (Ví dụ: Cứ 1 bệnh nhân thì ghép 1 người khỏe có cùng tuổi và giới tính...)",
-                        "inclusion_criteria": "Đâu là những tiêu chuẩn chọn chính để đưa bệnh nhân vào nghiên cứu?",
-                        "exclusion_criteria": "Trường hợp nào dù thỏa mãn tiêu chuẩn chọn nhưng bạn sẽ chủ động loại trừ khỏi nghiên cứu?",
-                        "randomization_method": "Chiến lược phân bổ ngẫu nhiên bạn hướng đến là gì? (Ví dụ: Simple, Blocked, máy tính...)",
-                        "blinding": "Dự kiến thiết kế làm mù như thế nào? (Ví dụ: Mù đơn - bệnh nhân không biết, mù đôi - cả BS lẫn BN đều không biết...)"
-                    }
-                    
-                    dynamic_form = [{
-                        "attribute_name": m, 
-                        "question_label": FALLBACK_LABELS.get(m, m.replace("_", " ").title()), 
-                        "description": FALLBACK_DESC.get(m, "Hãy mô tả chi tiết thông tin cho phần này."), 
-                        "placeholder": ""
-                    } for m in completeness.missing_elements]
+                    dynamic_form = [_fallback_form_field(m) for m in completeness.missing_elements]
 
                 # Always append the optional notes field
                 if dynamic_form is not None and isinstance(dynamic_form, list):
@@ -408,12 +435,15 @@ async def _process_chat_message(
         logger.info("[CHAT] Blueprint built: %s", blueprint.model_dump(exclude_none=True))
         response_text = _format_completion_message_short(blueprint)
         next_state = ConversationState.COMPLETE
+        _prefetch_pubmed_query(blueprint)
         await websocket.send_json({"type": "stream", "content": response_text, "done": False})
 
     else:
         next_state = ConversationState.CLARIFYING
         blueprint = None
 
+        streamed = ""  # prefix of the clarification message already sent
+        chunks: list[str] = []
         if completeness.missing_elements:
             # Build accepted/uncertain context dicts for the LLM prompt
             accepted_fields_ctx = {
@@ -434,21 +464,29 @@ async def _process_chat_message(
                     uncertain_fields=newly_uncertain or None,
                 )
 
-                response = await llm.complete(
+                # Stream the clarification JSON and forward its "message" field
+                # as it decodes, instead of waiting for the full form payload.
+                last_flush = time.monotonic()
+                async for chunk in llm.stream(
                     prompt=prompt,
                     system_prompt=SYSTEM_PROMPT,
                     temperature=0.3,
                     max_tokens=1500,
-                )
-
-                content = response.content.strip()
+                ):
+                    chunks.append(chunk)
+                    now = time.monotonic()
+                    if now - last_flush >= STREAM_FLUSH_INTERVAL:
+                        last_flush = now
+                        streamed = await _flush_partial_message(websocket, "".join(chunks), streamed)
+                streamed = await _flush_partial_message(websocket, "".join(chunks), streamed)
+
+                content = "".join(chunks).strip()
                 if content.startswith("```json"):
                     content = content[7:-3].strip()
                 elif content.startswith("```"):
                     content = content[3:-3].strip()
 
-                import json
-                data = json.loads(content)
+                data = orjson.loads(content)
                 response_text = data.get("message", "Vui lòng hoàn thiện các thông tin sau:")
 
                 # Validate attribute_names: only accept fields that map to real
@@ -467,37 +505,19 @@ async def _process_chat_message(
                 # Fallback: ensure every missing element has a form field
                 for _elem in completeness.missing_elements:
                     if _elem not in _covered:
-                        _valid_form.append({
-                            "attribute_name": _elem,
-                            "question_label": FALLBACK_LABELS.get(_elem, _elem.replace("_", " ").title()),
-                            "description": FALLBACK_DESC.get(_elem, "Hãy mô tả chi tiết thông tin phần này."),
-                            "placeholder": "",
-                        })
+                        _valid_form.append(_fallback_form_field(_elem))
                 dynamic_form = _valid_form
             except Exception as e:
                 logger.exception("LLM dynamic form generation failed")
                 response_text = "Để hoàn thiện thiết kế nghiên cứu, bạn vui lòng điền các thông tin còn thiếu vào form bên dưới nhé:"
+                # If the model's message already arrived in full, keep it so the
+                # client's streamed text and the saved turn stay identical
+                if streamed:
+                    message, closed = _partial_json_string("".join(chunks), _MESSAGE_FIELD_RE)
+                    if closed:
+                        response_text = message
 
-                FALLBACK_LABELS = {
-                    "population": "Đối tượng nghiên cứu", "sample_size": "Cỡ mẫu", "primary_endpoint": "Kết cục chính",
-                    "intervention": "Can thiệp", "comparator": "Nhóm chứng", "exposure": "Phơi nhiễm",
-                    "follow_up_duration": "Thời gian theo dõi", "reference_standard": "Tiêu chuẩn vàng",
-                    "search_strategy": "Chiến lược tìm kiếm", "databases": "Cơ sở dữ liệu", "case_definition": "Định nghĩa ca bệnh"
-                }
-                FALLBACK_DESC = {
-                    "population": "Đối tượng bạn cần nghiên cứu là gì? (Ví dụ: Trẻ em từ bao nhiêu tuổi, người lớn từ bao nhiêu tuổi, có phân biệt giới tính hay mắc bệnh nền không...)",
-                    "sample_size": "Cỡ mẫu dự kiến bao nhiêu bệnh nhân? (Ví dụ: Khoảng 100-200 bệnh nhân, hoặc lấy mẫu toàn bộ dự kiến được 50 ca...)",
-                    "primary_endpoint": "Kết cục chính để đánh giá là gì? (Ví dụ: Tỷ lệ tử vong sau 30 ngày, mức độ giảm đau sau 1 giờ, thời gian nằm viện...)",
-                    "intervention": "Can thiệp hoặc phương pháp điều trị bạn áp dụng là gì? (Ví dụ: Dùng thuốc A liều lượng B, hoặc phẫu thuật thủ thuật C...)",
-                    "comparator": "Nhóm chứng để đánh giá so sánh là gì? (Ví dụ: Phác đồ chuẩn, dùng thuốc giả dược (Placebo), hay không can thiệp...)",
-                    "exposure": "Nhóm yếu tố nguy cơ/phơi nhiễm bạn muốn đánh giá là gì? (Ví dụ: Tiếp xúc khói thuốc, làm việc ở hầm mỏ...)",
-                }
-                dynamic_form = [{
-                    "attribute_name": m,
-                    "question_label": FALLBACK_LABELS.get(m, m.replace("_", " ").title()),
-                    "description": FALLBACK_DESC.get(m, "Hãy mô tả chi tiết thông tin phần này."),
-                    "placeholder": ""
-                } for m in completeness.missing_elements]
+                dynamic_form = [_fallback_form_field(m) for m in completeness.missing_elements]
 
             # Augment retry fields with previous-answer metadata so the frontend
             # can highlight them differently from genuinely new fields.
@@ -522,11 +542,23 @@ async def _process_chat_message(
         else:
             response_text = "Cần thêm thông tin. Hãy mô tả thêm về nghiên cứu của bạn."
 
-        await websocket.send_json({
-            "type": "stream",
-            "content": response_text,
-            "done": False,
-        })
+        if response_text.startswith(streamed):
+            remainder = response_text[len(streamed):]
+            if remainder:
+                await websocket.send_json({
+                    "type": "stream",
+                    "content": remainder,
+                    "done": False,
+                })
+        else:
+            # The streamed prefix was abandoned: replace it with the text that
+            # is saved to conversation_turns
+            await websocket.send_json({
+                "type": "stream",
+                "content": response_text,
+                "done": False,
+                "replace": True,
+            })
 
     # Save assistant response
     await supabase_service.add_conversation_turn(
@@ -582,6 +614,67 @@ async def _process_chat_message(
     })
 
 
+def _prefetch_pubmed_query(blueprint) -> None:
+    """Speculatively build the PubMed query for the upcoming abstract generation.
+
+    The result lands in the LLM response cache (or is joined while still in
+    flight), so /abstract/generate skips that round trip on its critical path.
+    """
+    task = asyncio.create_task(build_pubmed_query(blueprint, get_llm_client()))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _partial_json_string(buffer: str, pattern: re.Pattern) -> tuple[str, bool]:
+    """Decode as much of a JSON string value as has arrived in ``buffer``.
+
+    ``pattern`` matches the key up to and including the opening quote.
+    Stops before an unterminated escape sequence so the result is always
+    a prefix of the final decoded value. The flag is True once the closing
+    quote has arrived, i.e. the value is complete.
+    """
+    match = pattern.search(buffer)
+    if not match:
+        return "", False
+    start = i = match.end()
+    end = len(buffer)
+    closed = False
+    while i < end:
+        ch = buffer[i]
+        if ch == '"':
+            closed = True
+            break
+        if ch == "\\":
+            if buffer[i + 1:i + 2] == "u":
+                # A high surrogate only decodes together with its low half,
+                # which may still be in the next chunk
+                step = 12 if "d800" <= buffer[i + 2:i + 6].lower() <= "dbff" else 6
+            else:
+                step = 2
+            if i + step > end:
+                break
+            i += step
+        else:
+            i += 1
+    try:
+        return json.loads('"' + buffer[start:i] + '"'), closed
+    except ValueError:
+        return "", False
+
+
+async def _flush_partial_message(websocket: WebSocket, buffer: str, streamed: str) -> str:
+    """Send the newly decoded part of the "message" field; return what has been sent."""
+    message, _ = _partial_json_string(buffer, _MESSAGE_FIELD_RE)
+    if len(message) > len(streamed) and message.startswith(streamed):
+        await websocket.send_json({
+            "type": "stream",
+            "content": message[len(streamed):],
+            "done": False,
+        })
+        return message
+    return streamed
+
+
 def _format_completion_message_short(blueprint) -> str:
     """Format checkpoint-1 summary message in natural Vietnamese."""
     design_display = blueprint.design_type.value.replace("_", " ").title()
@@ -7,7 +7,8 @@ from typing import Optional
 
 class Settings(BaseSettings):
     app_env: str = "development"
-    debug: bool = True
+    debug: bool = False  # Enable locally via DEBUG=true; exposes /debug/* endpoints
+    prewarm_on_startup: bool = True  # Warm Supabase, LLM and journal index at startup
 
     # LLM Providers
     anthropic_api_key: Optional[str] = None
@@ -43,6 +44,14 @@ class Settings(BaseSettings):
     # Frontend URL (for OAuth redirects)
     frontend_url: str = "http://localhost:5173"
 
+    # CORS allowed origins (localhost dev server included)
+    cors_origins: list[str] = [
+        "https://avr-app-9c203.web.app",
+        "https://avr-app-9c203.firebaseapp.com",
+        "http://localhost:5173",
+    ]
+    cors_max_age: int = 86400  # Seconds browsers may cache a preflight response
+
     # Rate limiting
     free_tier_daily_limit: int = 3  # Abstracts per day for free users
 
@@ -5,6 +5,7 @@ Modules:
 - auth: Authentication and JWT token management
 - ws_manager: WebSocket connection management
 - session_manager: In-memory session state
+- llm_cache: LRU + TTL cache for deterministic LLM responses
 
 Business logic lives in app/domain/:
 - domain/extraction: Attribute extraction and Vietnamese text processing
@@ -0,0 +1,72 @@
+"""
+In-process LRU + TTL cache for deterministic LLM responses.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def make_key(namespace: str, *parts: str) -> str:
+    """Hash a prompt namespace and its inputs into a fixed-size cache key."""
+    h = hashlib.blake2b(namespace.encode(), digest_size=16)
+    for part in parts:
+        h.update(b"\x00")
+        h.update(part.encode())
+    return h.hexdigest()
+
+
+class AsyncLRUTTL:
+    """
+    Bounded LRU cache whose entries expire after ``ttl`` seconds.
+
+    Only successful LLM results should be stored — fallbacks produced after
+    a provider error must not be cached, so a retry can still reach the LLM.
+    """
+
+    def __init__(self, capacity: int = 2048, ttl: float = 3600):
+        self.capacity = capacity
+        self.ttl = ttl
+        # key -> (expires_at, value)
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry."""
+        async with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    async def set(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entry if full."""
+        async with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "size": len(self._data),
+            "capacity": self.capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 3) if total else 0.0,
+        }
+
+
+# Global instance
+llm_cache = AsyncLRUTTL(capacity=2048, ttl=3600)
@@ -4,9 +4,11 @@ Supabase client for authentication and database operations.
 Tables: profiles, research_sessions, conversation_turns, violations
 """
 
+import asyncio
 from datetime import datetime
 from functools import lru_cache
 from typing import Optional
+from uuid import UUID
 import json
 
 from supabase import create_async_client, AsyncClient
@@ -45,6 +47,26 @@ class SupabaseService:
         self._client: Optional[AsyncClient] = None
         self._admin: Optional[AsyncClient] = None
 
+    async def connect(self) -> None:
+        """Eagerly create both clients so request handlers never pay the cold start.
+
+        Clients that are not configured are skipped; get_client()/get_admin()
+        will raise the usual ValueError when they are actually needed.
+        """
+        # The two clients are independent, so their TLS setup overlaps
+        await asyncio.gather(
+            self._ensure("_client", get_supabase_client),
+            self._ensure("_admin", get_supabase_admin),
+        )
+
+    async def _ensure(self, attr: str, factory) -> None:
+        """Create the client stored in ``attr`` unless it exists or isn't configured."""
+        if getattr(self, attr) is None:
+            try:
+                setattr(self, attr, await factory())
+            except ValueError:
+                pass
+
     async def get_client(self) -> AsyncClient:
         """Get regular client (uses publishable key)."""
         if self._client is None:
@@ -113,11 +135,11 @@ class SupabaseService:
             # PGRST116: no row found — profile doesn't exist yet
             return None
 
-    async def update_profile(self, user_id: str, updates: dict) -> dict:
-        """Update user profile."""
+    async def update_profile(self, user_id: str, updates: dict) -> Optional[dict]:
+        """Update user profile. Returns None if no row matched."""
         admin = await self.get_admin()
         response = await admin.table("profiles").update(updates).eq("id", user_id).execute()
-        return response.data[0] if response.data else {}
+        return response.data[0] if response.data else None
 
     async def increment_runs_today(self, user_id: str) -> int:
         """Increment runs_today counter and return new value."""
@@ -220,8 +242,8 @@ class SupabaseService:
         self,
         user_id: str,
         phase: str = "phase1",
-    ) -> dict:
-        """Create a new research session."""
+    ) -> Optional[dict]:
+        """Create a new research session. Returns None if the insert returned no row."""
         data = {
             "user_id": user_id,
             "phase": phase,
@@ -235,7 +257,7 @@ class SupabaseService:
         }
         admin = await self.get_admin()
         response = await admin.table("research_sessions").insert(data).execute()
-        return response.data[0] if response.data else {}
+        return response.data[0] if response.data else None
 
     async def get_research_session(self, session_id: str) -> Optional[dict]:
         """Get a research session by ID."""
@@ -247,8 +269,8 @@ class SupabaseService:
         self,
         session_id: str,
         updates: dict,
-    ) -> dict:
-        """Update a research session."""
+    ) -> Optional[dict]:
+        """Update a research session. Returns the updated row, or None if no row matched."""
         # Convert complex objects to JSON if needed
         for key in ["extracted_attributes", "blueprint", "violations",
                     "journal_suggestions", "score_history", "abstract_versions"]:
@@ -258,7 +280,7 @@ class SupabaseService:
 
         admin = await self.get_admin()
         response = await admin.table("research_sessions").update(updates).eq("id", session_id).execute()
-        return response.data[0] if response.data else {}
+        return response.data[0] if response.data else None
 
     async def get_user_sessions(
         self,
@@ -267,20 +289,41 @@ class SupabaseService:
         status: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        after_updated_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
     ) -> list[dict]:
-        """Get user's research sessions with optional filters."""
+        """Get user's research sessions with optional filters.
+
+        Pass the (updated_at, id) of the last row of the previous page as
+        after_updated_at/after_id for keyset pagination, which stays an index
+        range scan on idx_research_sessions_user_updated at any depth.
+        offset is kept for older clients; with a cursor it is not used, and
+        after_id is only applied together with after_updated_at.
+        """
         admin = await self.get_admin()
         query = (
             admin.table("research_sessions")
             .select("id, phase, status, conversation_state, created_at, updated_at")
             .eq("user_id", user_id)
-            .order("updated_at", desc=True)
         )
         if phase:
             query = query.eq("phase", phase)
         if status:
             query = query.eq("status", status)
-        query = query.range(offset, offset + limit - 1)
+        if after_updated_at is not None:
+            ts = after_updated_at.isoformat()
+            if after_id is not None:
+                # A UUID renders as plain hex and hyphens, so it is safe inside the filter
+                query = query.or_(
+                    f'updated_at.lt."{ts}",and(updated_at.eq."{ts}",id.lt.{after_id})'
+                )
+            else:
+                query = query.lt("updated_at", ts)
+        query = query.order("updated_at", desc=True).order("id", desc=True)
+        if after_updated_at is not None:
+            query = query.limit(limit)
+        else:
+            query = query.range(offset, offset + limit - 1)
         response = await query.execute()
         return response.data or []
 
@@ -297,11 +340,11 @@ class SupabaseService:
         self,
         session_id: str,
         score: float,
-    ) -> dict:
+    ) -> Optional[dict]:
         """Append a score to the session's score history."""
         session = await self.get_research_session(session_id)
         if not session:
-            return {}
+            return None
 
         history = session.get("score_history") or []
         history.append(score)
@@ -318,11 +361,11 @@ class SupabaseService:
         self,
         session_id: str,
         abstract: str,
-    ) -> dict:
+    ) -> Optional[dict]:
         """Append an abstract version to history."""
         session = await self.get_research_session(session_id)
         if not session:
-            return {}
+            return None
 
         versions = session.get("abstract_versions") or []
         versions.append({
@@ -7,10 +7,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+import orjson
 from fastapi import WebSocket
 
 
-@dataclass
+@dataclass(slots=True)
 class UserConnection:
     """Represents a single WebSocket connection."""
 
@@ -101,9 +102,14 @@ class WebSocketManager:
 
     async def broadcast_to_user(self, user_id: str, message: dict):
         """Send message to all connections of a user."""
-        for conn in self._connections.get(user_id, []):
+        connections = self._connections.get(user_id)
+        if not connections:
+            return
+        # Serialize once for every connection instead of once per send_json
+        text = orjson.dumps(message).decode()
+        for conn in connections:
             try:
-                await conn.websocket.send_json(message)
+                await conn.websocket.send_text(text)
             except Exception:
                 # Connection might be closed
                 pass
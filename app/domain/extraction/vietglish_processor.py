@@ -1,18 +1,27 @@
 import re
 
 class VietglishProcessor:
-    def __init__(self):
-        # Common Viet-glish patterns
-        self.patterns = [
-            {"name": "According to... showed that", "pattern": r"According to .* showed that", "type": "redundancy"},
-            {"name": "Present perfect confusion", "pattern": r"has been .* since \d+", "type": "tense"},
-            # Add more patterns here
-        ]
-    
+    # Common Viet-glish patterns
+    patterns = [
+        {"name": "According to... showed that", "pattern": r"According to .* showed that", "type": "redundancy"},
+        {"name": "Present perfect confusion", "pattern": r"has been .* since \d+", "type": "tense"},
+        # Add more patterns here
+    ]
+
+    # (compiled regex, pattern dict) pairs shared by every instance
+    _compiled: tuple = ()
+
+    @classmethod
+    def compile_patterns(cls) -> None:
+        """Compile the pattern table once per process; instances reuse it."""
+        cls._compiled = tuple(
+            (re.compile(p["pattern"], re.IGNORECASE), p) for p in cls.patterns
+        )
+
     def analyze(self, text: str) -> list:
         errors = []
-        for p in self.patterns:
-            if re.search(p["pattern"], text, re.IGNORECASE):
+        for regex, p in self._compiled:
+            if regex.search(text):
                 errors.append({
                     "pattern": p["name"],
                     "type": p["type"],
@@ -20,4 +29,5 @@ class VietglishProcessor:
                 })
         return errors
 
+VietglishProcessor.compile_patterns()
 vietglish_processor = VietglishProcessor()
@@ -37,6 +37,10 @@ BASE_SCORE = 100
 # Maximum score when MAJOR violations exist (R-09)
 MAX_SCORE_WITH_MAJOR = 10
 
+# Fix order: BLOCK > MAJOR > WARN
+SEVERITY_ORDER = (ViolationSeverity.BLOCK, ViolationSeverity.MAJOR, ViolationSeverity.WARN)
+SEVERITY_PRIORITY = {severity: i for i, severity in enumerate(SEVERITY_ORDER)}
+
 
 @dataclass
 class GateCheckResult:
@@ -237,17 +241,13 @@ def format_violations_for_display(violations: list[Violation]) -> list[dict]:
     result = []
 
     # Group by severity
-    by_severity = {
-        ViolationSeverity.BLOCK: [],
-        ViolationSeverity.MAJOR: [],
-        ViolationSeverity.WARN: [],
-    }
+    by_severity = {severity: [] for severity in SEVERITY_ORDER}
 
     for v in violations:
         by_severity[v.severity].append(v)
 
     # Format each group
-    for severity in [ViolationSeverity.BLOCK, ViolationSeverity.MAJOR, ViolationSeverity.WARN]:
+    for severity in SEVERITY_ORDER:
         for v in by_severity[severity]:
             result.append({
                 "code": v.code,
@@ -287,15 +287,9 @@ def get_improvement_priority(violations: list[Violation]) -> list[dict]:
     Returns violations sorted by priority for fixing.
     """
     # Priority order: BLOCK > MAJOR > WARN, then by tier (lower first)
-    priority_map = {
-        ViolationSeverity.BLOCK: 0,
-        ViolationSeverity.MAJOR: 1,
-        ViolationSeverity.WARN: 2,
-    }
-
     sorted_violations = sorted(
         violations,
-        key=lambda v: (priority_map.get(v.severity, 3), v.tier)
+        key=lambda v: (SEVERITY_PRIORITY.get(v.severity, 3), v.tier)
     )
 
     return [
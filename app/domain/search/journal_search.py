@@ -4,29 +4,45 @@ This module implements R-08: Journal search via ChromaDB
 using sentence-transformers for embeddings.
 """
 
-import json
 import os
+import threading
 from typing import Optional
 from pathlib import Path
 
+import orjson
+
 from app.config import get_settings
 
 # ─── Source JSON enrichment cache ─────────────────────────────────────────────
+# Display fields are derived once per journal at load time, not per search hit
 _journal_source_cache: dict[str, dict] = {}
+_NO_SOURCE = {"open_access": None, "citation_style": None, "quartile": None, "abstract_limit": None}
+
+
+def _source_display_fields(journal: dict) -> dict:
+    """Precompute the search-result fields taken from journals_source.json."""
+    abstract_words = (journal.get("word_limits") or {}).get("abstract")
+    return {
+        "open_access": journal.get("open_access"),
+        "citation_style": journal.get("citation_style"),
+        "quartile": journal.get("quartile"),
+        "abstract_limit": f"≤ {abstract_words} từ" if abstract_words else None,
+    }
 
 
 def _get_journal_source_map() -> dict[str, dict]:
-    """Load journals_source.json once and cache by id."""
+    """Load journals_source.json once and cache display fields by id."""
     global _journal_source_cache
     if not _journal_source_cache:
-        source_path = Path(__file__).parent.parent.parent / "data" / "journals_source.json"
-        if source_path.exists():
-            try:
-                with open(source_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    _journal_source_cache = {j["id"]: j for j in data}
-            except Exception:
-                pass
+        with _init_lock:
+            if not _journal_source_cache:
+                source_path = Path(__file__).parent.parent.parent / "data" / "journals_source.json"
+                if source_path.exists():
+                    try:
+                        data = orjson.loads(source_path.read_bytes())
+                        _journal_source_cache = {j["id"]: _source_display_fields(j) for j in data}
+                    except Exception:
+                        pass
     return _journal_source_cache
 
 # Lazy imports to avoid loading heavy libraries on startup
@@ -34,25 +50,32 @@ _chroma_client = None
 _collection = None
 _embedding_model = None
 
+# Searches run in worker threads (asyncio.to_thread), so initialisation is
+# guarded to build each global once. Reentrant: the collection getter
+# calls the client getter while holding it.
+_init_lock = threading.RLock()
+
 
 def get_chroma_client():
     """Get or create ChromaDB client."""
     global _chroma_client
 
     if _chroma_client is None:
-        import chromadb
-        from chromadb.config import Settings
+        with _init_lock:
+            if _chroma_client is None:
+                import chromadb
+                from chromadb.config import Settings
 
-        settings = get_settings()
-        persist_dir = settings.chroma_db_path or "./app/data/chroma_journals"
+                settings = get_settings()
+                persist_dir = settings.chroma_db_path or "./app/data/chroma_journals"
 
-        # Ensure directory exists
-        Path(persist_dir).mkdir(parents=True, exist_ok=True)
+                # Ensure directory exists
+                Path(persist_dir).mkdir(parents=True, exist_ok=True)
 
-        _chroma_client = chromadb.PersistentClient(
-            path=persist_dir,
-            settings=Settings(anonymized_telemetry=False)
-        )
+                _chroma_client = chromadb.PersistentClient(
+                    path=persist_dir,
+                    settings=Settings(anonymized_telemetry=False)
+                )
 
     return _chroma_client
 
@@ -62,12 +85,14 @@ def get_embedding_model():
     global _embedding_model
 
     if _embedding_model is None:
-        from sentence_transformers import SentenceTransformer
+        with _init_lock:
+            if _embedding_model is None:
+                from sentence_transformers import SentenceTransformer
 
-        settings = get_settings()
-        model_name = settings.embedding_model or "all-MiniLM-L6-v2"
+                settings = get_settings()
+                model_name = settings.embedding_model or "all-MiniLM-L6-v2"
 
-        _embedding_model = SentenceTransformer(model_name)
+                _embedding_model = SentenceTransformer(model_name)
 
     return _embedding_model
 
@@ -77,11 +102,13 @@ def get_journal_collection():
     global _collection
 
     if _collection is None:
-        client = get_chroma_client()
-        _collection = client.get_or_create_collection(
-            name="journals",
-            metadata={"description": "Medical journals for matching"}
-        )
+        with _init_lock:
+            if _collection is None:
+                client = get_chroma_client()
+                _collection = client.get_or_create_collection(
+                    name="journals",
+                    metadata={"description": "Medical journals for matching"}
+                )
 
     return _collection
 
@@ -124,38 +151,40 @@ def search_journals(
             include=["documents", "metadatas", "distances"]
         )
 
-        # Process results
+        # Process results column-wise: Chroma returns one list per field
         journals = []
         if results and results["ids"] and results["ids"][0]:
-            for i, journal_id in enumerate(results["ids"][0]):
-                # Convert distance to similarity score
-                distance = results["distances"][0][i] if results["distances"] else 0
+            ids = results["ids"][0]
+            distances = results["distances"][0] if results["distances"] else [0] * len(ids)
+            metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(ids)
+            documents = results["documents"][0] if results["documents"] else [""] * len(ids)
+            source_map = _get_journal_source_map()
+
+            for journal_id, distance, metadata, document in zip(ids, distances, metadatas, documents):
                 # Chroma uses L2 distance by default, convert to similarity
                 similarity = 1 / (1 + distance)
-
-                if similarity >= min_score:
-                    metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-                    source = _get_journal_source_map().get(journal_id, {})
-                    word_limits = source.get("word_limits") or {}
-                    abstract_words = word_limits.get("abstract")
-                    # Fallback to ChromaDB metadata for fields not in source map
-                    open_access = source.get("open_access") or metadata.get("open_access")
-                    citation_style = source.get("citation_style") or metadata.get("citation_style")
-                    quartile = source.get("quartile") or metadata.get("quartile")
-                    journals.append({
-                        "journal_id": journal_id,
-                        "name": metadata.get("name", ""),
-                        "issn": metadata.get("issn"),
-                        "impact_factor": metadata.get("impact_factor"),
-                        "specialty": metadata.get("specialty"),
-                        "publisher": metadata.get("publisher"),
-                        "open_access": open_access,
-                        "citation_style": citation_style,
-                        "quartile": quartile,
-                        "abstract_limit": f"≤ {abstract_words} từ" if abstract_words else None,
-                        "similarity_score": round(similarity, 3),
-                        "description": results["documents"][0][i] if results["documents"] else "",
-                    })
+                if similarity < min_score:
+                    continue
+
+                source = source_map.get(journal_id, _NO_SOURCE)
+                # Fallback to ChromaDB metadata for fields not in source map
+                open_access = source["open_access"] or metadata.get("open_access")
+                citation_style = source["citation_style"] or metadata.get("citation_style")
+                quartile = source["quartile"] or metadata.get("quartile")
+                journals.append({
+                    "journal_id": journal_id,
+                    "name": metadata.get("name", ""),
+                    "issn": metadata.get("issn"),
+                    "impact_factor": metadata.get("impact_factor"),
+                    "specialty": metadata.get("specialty"),
+                    "publisher": metadata.get("publisher"),
+                    "open_access": open_access,
+                    "citation_style": citation_style,
+                    "quartile": quartile,
+                    "abstract_limit": source["abstract_limit"],
+                    "similarity_score": round(similarity, 3),
+                    "description": document,
+                })
 
         return journals
 
@@ -193,8 +222,8 @@ def get_journal_by_id(journal_id: str) -> Optional[dict]:
                 "impact_factor": metadata.get("impact_factor"),
                 "specialty": metadata.get("specialty"),
                 "publisher": metadata.get("publisher"),
-                "word_limits": json.loads(wl_raw) if isinstance(wl_raw, str) else wl_raw,
-                "section_requirements": json.loads(sr_raw) if isinstance(sr_raw, str) else (sr_raw or []),
+                "word_limits": orjson.loads(wl_raw) if isinstance(wl_raw, str) else wl_raw,
+                "section_requirements": orjson.loads(sr_raw) if isinstance(sr_raw, str) else (sr_raw or []),
                 "author_guidelines_url": metadata.get("author_guidelines_url"),
                 "description": result["documents"][0] if result["documents"] else "",
             }
@@ -263,7 +292,6 @@ def add_journals_batch(journals: list[dict]) -> int:
         model = get_embedding_model()
 
         ids = []
-        embeddings = []
         documents = []
         metadatas = []
 
@@ -275,9 +303,6 @@ def add_journals_batch(journals: list[dict]) -> int:
             if not journal_id or not description:
                 continue
 
-            # Generate embedding
-            embedding = model.encode(description).tolist()
-
             # Build metadata (ChromaDB requires flat scalar values)
             word_limits = journal.get("word_limits")
             section_requirements = journal.get("section_requirements")
@@ -290,19 +315,21 @@ def add_journals_batch(journals: list[dict]) -> int:
                 "open_access": journal.get("open_access"),
                 "citation_style": journal.get("citation_style"),
                 "quartile": journal.get("quartile"),
-                "word_limits": json.dumps(word_limits) if word_limits else None,
-                "section_requirements": json.dumps(section_requirements) if section_requirements else None,
+                "word_limits": orjson.dumps(word_limits).decode() if word_limits else None,
+                "section_requirements": orjson.dumps(section_requirements).decode() if section_requirements else None,
                 "author_guidelines_url": journal.get("author_guidelines_url"),
             }
             # Remove None values
             meta = {k: v for k, v in meta.items() if v is not None}
 
             ids.append(journal_id)
-            embeddings.append(embedding)
             documents.append(description)
             metadatas.append(meta)
 
         if ids:
+            # Encode all descriptions in one batched forward pass instead of
+            # one model call per journal
+            embeddings = model.encode(documents, batch_size=64).tolist()
             collection.add(
                 ids=ids,
                 embeddings=embeddings,
@@ -317,6 +344,24 @@ def add_journals_batch(journals: list[dict]) -> int:
         return 0
 
 
+def preload() -> bool:
+    """
+    Load the Chroma collection, embedding model and source map ahead of the
+    first search so no request pays the model load and index open cost.
+
+    Blocking; run it off the event loop.
+    """
+    try:
+        _get_journal_source_map()
+        get_journal_collection()
+        # First encode() initialises the tokenizer and weights lazily
+        get_embedding_model().encode("warmup")
+        return True
+    except Exception as e:
+        print(f"Journal preload error: {e}")
+        return False
+
+
 def get_collection_stats() -> dict:
     """Get statistics about the journals collection."""
     try:
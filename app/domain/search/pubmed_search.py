@@ -5,6 +5,8 @@ from typing import Optional
 
 import httpx
 
+from app.core.llm_cache import llm_cache, make_key
+
 logger = logging.getLogger(__name__)
 
 ENTREZ_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
@@ -106,11 +108,16 @@ async def build_pubmed_query(blueprint, llm) -> str:
     try:
         from app.llm.prompts.pubmed_query import get_pubmed_query_prompt, SYSTEM_PROMPT
         prompt = get_pubmed_query_prompt(blueprint)
-        
+
+        cache_key = make_key("pubmed_query", prompt)
+        cached = await llm_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         response = await llm.complete(
             prompt=prompt,
             system_prompt=SYSTEM_PROMPT,
-            temperature=0.2, # Keep it strictly compliant
+            temperature=0,  # Deterministic, so the cached query is the one it would return
             max_tokens=200,
         )
         
@@ -122,7 +129,8 @@ async def build_pubmed_query(blueprint, llm) -> str:
         # Ensure it has something
         if len(query) < 5:
             raise ValueError("Query string too short")
-            
+
+        await llm_cache.set(cache_key, query)
         return query
     except Exception as e:
         logger.error("Failed to generate PubMed query with LLM: %s. Using simple fallback.", e)
@@ -4,16 +4,21 @@ This module provides a unified interface to multiple LLM providers,
 with OpenRouter as primary and direct providers as fallback.
 """
 
+import asyncio
 import os
 import logging
 from typing import Optional, AsyncGenerator
 from dataclasses import dataclass
 import httpx
+import orjson
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Used when LOCAL_MODEL is unset; Ollama serves this tag as a 4-bit (q4_K_M) build
+DEFAULT_LOCAL_MODEL = "gemma3:4b"
+
 
 @dataclass
 class LLMResponse:
@@ -30,13 +35,69 @@ class LLMClient:
     def __init__(self):
         self.settings = get_settings()
         self._http_client = None
+        # Provider SDK clients, created once so their connection pools are reused
+        self._anthropic_client = None
+        self._openai_client = None
+        self._google_client = None
+        # Identical temperature-0 requests in flight: (prompt, system, model, temp, max_tokens) -> task
+        self._inflight: dict[tuple, asyncio.Task] = {}
 
     @property
     def http_client(self) -> httpx.AsyncClient:
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=60.0)
+            self._http_client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=600),
+            )
         return self._http_client
 
+    @property
+    def anthropic_client(self):
+        if self._anthropic_client is None:
+            from anthropic import AsyncAnthropic
+            self._anthropic_client = AsyncAnthropic(api_key=self.settings.anthropic_api_key)
+        return self._anthropic_client
+
+    @property
+    def openai_client(self):
+        if self._openai_client is None:
+            from openai import AsyncOpenAI
+            self._openai_client = AsyncOpenAI(api_key=self.settings.openai_api_key)
+        return self._openai_client
+
+    @property
+    def google_client(self):
+        if self._google_client is None:
+            from google import genai
+            self._google_client = genai.Client(api_key=self.settings.google_api_key)
+        return self._google_client
+
+    async def warmup(self):
+        """
+        Open connections to the configured providers before the first request.
+
+        Sends no prompts (no tokens are spent): HTTP providers get a HEAD
+        request to establish the TLS connection in the keep-alive pool, and
+        SDK clients are constructed so their imports and pools are ready.
+        """
+        urls = []
+        if self.settings.openrouter_api_key:
+            urls.append("https://openrouter.ai/api/v1/models")
+        if self.settings.default_provider == "local" and self.settings.local_base_url:
+            urls.append(self.settings.local_base_url)
+        for url in urls:
+            try:
+                await self.http_client.head(url)
+            except httpx.HTTPError as e:
+                logger.warning("LLM warmup request to %s failed: %s", url, e)
+
+        if self.settings.anthropic_api_key:
+            self.anthropic_client
+        if self.settings.openai_api_key:
+            self.openai_client
+        if self.settings.google_api_key:
+            self.google_client
+
     async def close(self):
         if self._http_client:
             await self._http_client.aclose()
@@ -56,7 +117,51 @@ class LLMClient:
 
         Provider priority: configured default first, then cloud fallbacks.
         Pass user_id to automatically track token usage after a successful call.
+
+        Concurrent temperature-0 calls with identical arguments share one
+        provider request; each caller is charged for the tokens of the response
+        it receives. Sampled calls (temperature > 0) always get their own sample.
         """
+        if temperature != 0:
+            return await self._complete(prompt, system_prompt, model, temperature, max_tokens, user_id)
+
+        key = (prompt, system_prompt, model, temperature, max_tokens)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._complete(prompt, system_prompt, model, temperature, max_tokens, user_id)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._inflight_done(key, t))
+            # Shield so one caller disconnecting does not cancel the shared request
+            return await asyncio.shield(task)
+
+        logger.info("[LLM] Joining in-flight request — prompt_chars=%d", len(prompt))
+        resp = await asyncio.shield(task)
+        await self._track_usage(user_id, resp)
+        return resp
+
+    def _inflight_done(self, key: tuple, task: asyncio.Task) -> None:
+        """Forget a finished shared request and retrieve its exception.
+
+        Every waiter may have been cancelled by the time the shielded task
+        fails; retrieving the exception here keeps asyncio from logging
+        "exception was never retrieved".
+        """
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def _complete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        model: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        user_id: Optional[str],
+    ) -> LLMResponse:
+        """Route a completion through the provider fallback chain."""
         provider = self.settings.default_provider
 
         # 1. Local (Ollama) – preferred when explicitly configured
@@ -141,7 +246,8 @@ class LLMClient:
         """
         Stream completion from LLM.
 
-        Routes to provider based on default_provider setting.
+        Routes to provider based on default_provider setting. If the stream
+        fails before yielding anything, falls back to complete().
         """
         provider = self.settings.default_provider
         logger.info(
@@ -196,9 +302,18 @@ class LLMClient:
             response = await self.complete(prompt, system_prompt, model, temperature, max_tokens)
             yield response.content
 
-        async for chunk in _route():
-            accumulated.append(chunk)
-            yield chunk
+        try:
+            async for chunk in _route():
+                accumulated.append(chunk)
+                yield chunk
+        except Exception as e:
+            if accumulated:
+                raise
+            # Nothing sent yet: retry through complete()'s provider fallback chain
+            logger.warning("[LLM STREAM] %s stream failed before first chunk: %s", provider, e)
+            response = await self.complete(prompt, system_prompt, model, temperature, max_tokens)
+            accumulated.append(response.content)
+            yield response.content
 
         full_text = "".join(accumulated)
         logger.info(
@@ -215,9 +330,7 @@ class LLMClient:
         max_tokens: int,
     ) -> LLMResponse:
         """Call local Ollama / OpenAI-compatible server."""
-        import json
-
-        model = model or self.settings.local_model or "gemma3:4b"
+        model = model or self.settings.local_model or DEFAULT_LOCAL_MODEL
         base_url = self.settings.local_base_url.rstrip("/")
 
         messages = []
@@ -236,7 +349,7 @@ class LLMClient:
             },
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         return LLMResponse(
             content=data["choices"][0]["message"]["content"],
@@ -254,9 +367,7 @@ class LLMClient:
         max_tokens: int,
     ) -> AsyncGenerator[str, None]:
         """Stream from local Ollama / OpenAI-compatible server."""
-        import json
-
-        model = model or self.settings.local_model or "gemma3:4b"
+        model = model or self.settings.local_model or DEFAULT_LOCAL_MODEL
         base_url = self.settings.local_base_url.rstrip("/")
 
         messages = []
@@ -282,11 +393,11 @@ class LLMClient:
                     if data_str.strip() == "[DONE]":
                         break
                     try:
-                        data = json.loads(data_str)
+                        data = orjson.loads(data_str)
                         delta = data["choices"][0].get("delta", {})
                         if delta.get("content"):
                             yield delta["content"]
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
 
     async def _call_openrouter(
@@ -320,7 +431,7 @@ class LLMClient:
             },
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         return LLMResponse(
             content=data["choices"][0]["message"]["content"],
@@ -338,8 +449,6 @@ class LLMClient:
         max_tokens: int,
     ) -> AsyncGenerator[str, None]:
         """Stream from OpenRouter API."""
-        import json
-
         model = model or "anthropic/claude-3.5-sonnet"
 
         messages = []
@@ -370,10 +479,10 @@ class LLMClient:
                     if data_str.strip() == "[DONE]":
                         break
                     try:
-                        data = json.loads(data_str)
+                        data = orjson.loads(data_str)
                         if data["choices"][0].get("delta", {}).get("content"):
                             yield data["choices"][0]["delta"]["content"]
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
 
     async def _call_anthropic(
@@ -385,9 +494,7 @@ class LLMClient:
         max_tokens: int,
     ) -> LLMResponse:
         """Call Anthropic API directly."""
-        from anthropic import AsyncAnthropic
-
-        client = AsyncAnthropic(api_key=self.settings.anthropic_api_key)
+        client = self.anthropic_client
         model = model or "claude-3-5-sonnet-20241022"
 
         response = await client.messages.create(
@@ -417,9 +524,7 @@ class LLMClient:
         max_tokens: int,
     ) -> AsyncGenerator[str, None]:
         """Stream from Anthropic API."""
-        from anthropic import AsyncAnthropic
-
-        client = AsyncAnthropic(api_key=self.settings.anthropic_api_key)
+        client = self.anthropic_client
         model = model or "claude-3-5-sonnet-20241022"
 
         async with client.messages.stream(
@@ -441,10 +546,9 @@ class LLMClient:
         max_tokens: int,
     ) -> LLMResponse:
         """Call Google Gemini API (non-streaming)."""
-        from google import genai
         from google.genai import types
 
-        client = genai.Client(api_key=self.settings.google_api_key)
+        client = self.google_client
         model = model or self.settings.google_model or "gemini-2.5-pro"
 
         config = types.GenerateContentConfig(
@@ -478,10 +582,9 @@ class LLMClient:
         max_tokens: int,
     ) -> AsyncGenerator[str, None]:
         """Stream from Google Gemini API."""
-        from google import genai
         from google.genai import types
 
-        client = genai.Client(api_key=self.settings.google_api_key)
+        client = self.google_client
         model = model or self.settings.google_model or "gemini-2.5-pro"
         logger.info("[LLM STREAM] google model resolved → %s", model)
 
@@ -515,9 +618,7 @@ class LLMClient:
         max_tokens: int,
     ) -> LLMResponse:
         """Call OpenAI API directly."""
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=self.settings.openai_api_key)
+        client = self.openai_client
         model = model or "gpt-4o"
 
         messages = []
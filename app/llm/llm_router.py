@@ -20,15 +20,24 @@ Usage:
     result = await llm_router.call(prompt="Hello", model="gpt-4o-mini")
 """
 
+import re
 from abc import ABC, abstractmethod
 from typing import Optional
-import json
+
+import orjson
 
 from app.config import get_settings
 
 settings = get_settings()
 
 
+# Compiled once; _clean_json_response runs on every JSON-mode response
+_THINK_BLOCK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_THINK_OPEN_RE = re.compile(r"<think>.*", re.DOTALL)
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([\]}])")
+
+
 def _clean_json_response(text: str) -> str:
     """Clean LLM response to extract valid JSON.
 
@@ -39,20 +48,18 @@ def _clean_json_response(text: str) -> str:
     - Trailing commas before ] or } (common LLM mistake)
     - Unterminated strings (try to close them)
     """
-    import re
-
     text = text.strip()
 
     # Strip DeepSeek R1 <think>...</think> tags (complete or truncated)
     # First try complete tags
-    text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+    text = _THINK_BLOCK_RE.sub("", text).strip()
     # Then strip truncated thinking (no closing tag - model ran out of tokens)
     if "<think>" in text:
-        text = re.sub(r"<think>.*", "", text, flags=re.DOTALL).strip()
+        text = _THINK_OPEN_RE.sub("", text).strip()
 
     # Strip markdown code blocks
     if "```" in text:
-        match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
+        match = _CODE_FENCE_RE.search(text)
         if match:
             text = match.group(1).strip()
 
@@ -64,8 +71,7 @@ def _clean_json_response(text: str) -> str:
                 break
 
     # Remove trailing commas before ] or } (invalid JSON but common LLM output)
-    text = re.sub(r",\s*]", "]", text)
-    text = re.sub(r",\s*}", "}", text)
+    text = _TRAILING_COMMA_RE.sub(r"\1", text)
 
     # Fix unterminated strings: count unescaped quotes
     # If odd, the last string is unterminated - try to close it
@@ -370,6 +376,8 @@ class LLMRouter:
     
     def __init__(self):
         self._providers: dict[str, LLMProvider] = {}
+        # Resolved once; settings are static, so only register_provider invalidates it
+        self._default_provider: Optional[str] = None
         self._provider_classes = {
             "local": LocalProvider,
             "anthropic": AnthropicProvider,
@@ -389,6 +397,8 @@ class LLMRouter:
     def register_provider(self, name: str, provider_class: type[LLMProvider]):
         """Register a custom provider class."""
         self._provider_classes[name] = provider_class
+        self._providers.pop(name, None)
+        self._default_provider = None
     
     @property
     def available_providers(self) -> list[str]:
@@ -400,13 +410,18 @@ class LLMRouter:
     
     def get_default_provider(self) -> str:
         """Get the default provider, falling back if not available."""
+        if self._default_provider is not None:
+            return self._default_provider
+
         default = settings.default_provider
         if self._get_provider(default).is_available:
+            self._default_provider = default
             return default
         
         # Fallback to first available provider
         for name in self._provider_classes:
             if self._get_provider(name).is_available:
+                self._default_provider = name
                 return name
         
         raise RuntimeError("No LLM providers are configured. Please set at least one API key.")
@@ -457,10 +472,16 @@ class LLMRouter:
             )
 
         if json_output:
+            # Well-formed responses skip the regex cleanup entirely
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+
             cleaned = _clean_json_response(text)
             try:
-                return json.loads(cleaned)
-            except json.JSONDecodeError as e:
+                return orjson.loads(cleaned)
+            except orjson.JSONDecodeError as e:
                 # Wrap in ValueError to avoid confusion with client JSON errors
                 raise ValueError(
                     f"LLM returned invalid JSON: {e}. "
@@ -33,6 +33,75 @@ XU LY THONG TIN CHUA RO RANG:
 - Dinh kem huong dan cho cac truong con thieu: "Neu ban khong ro, ban co the dien 'Chưa xác định'"."""
 
 
+# Static prompt text and lookup tables, built once at import time
+
+_ACCEPTED_DISPLAY_NAMES = {
+    "population": "Đối tượng nghiên cứu", "sample_size": "Cỡ mẫu",
+    "primary_endpoint": "Kết cục chính", "intervention": "Can thiệp",
+    "comparator": "Nhóm chứng", "exposure": "Phơi nhiễm",
+    "follow_up_duration": "Thời gian theo dõi", "design_type": "Thiết kế nghiên cứu",
+}
+
+_ATTRIBUTE_DISPLAY_NAMES = {
+    "population": "Dan so nghien cuu",
+    "sample_size": "Co mau",
+    "age_range": "Do tuoi",
+    "intervention": "Can thiep",
+    "comparator": "Doi chung",
+    "exposure": "Phoi nhiem",
+    "primary_endpoint": "Ket qua chinh",
+    "secondary_endpoints": "Ket qua phu",
+    "design_type": "Thiet ke",
+    "setting": "Dia diem",
+    "duration": "Thoi gian",
+    "follow_up_duration": "Thoi gian theo doi",
+    "case_definition": "Dinh nghia ca benh",
+    "control_definition": "Dinh nghia nhom chung",
+    "matching_criteria": "Tieu chi ghep cap",
+    "reference_standard": "Tieu chuan vang",
+    "search_strategy": "Chien luoc tim kiem",
+    "databases": "Co so du lieu",
+    "data_collection_method": "Phuong phap thu thap du lieu",
+    "randomization_method": "Phuong phap ngau nhien",
+    "blinding": "Lam mu",
+    "data_source": "Nguon du lieu",
+    "inclusion_criteria": "Tieu chuan chon",
+    "exclusion_criteria": "Tieu chuan loai",
+}
+
+_MISSING_EXPLANATIONS = {
+    "population": "Dan so nghien cuu (ai se duoc nghien cuu?)",
+    "sample_size": "Co mau (bao nhieu benh nhan?)",
+    "primary_endpoint": "Ket qua chinh (do luong gi?)",
+    "intervention": "Can thiep (lam gi cho benh nhan?)",
+    "comparator": "Nhom doi chung (so sanh voi gi?)",
+    "exposure": "Yeu to phoi nhiem (yeu to nguy co nao?)",
+    "design_type": "Thiet ke nghien cuu (RCT, cohort, cross-sectional...)",
+    "follow_up_duration": "Thoi gian theo doi",
+    "reference_standard": "Tieu chuan vang (gold standard)",
+    "case_definition": "Dinh nghia ca benh",
+    "control_definition": "Dinh nghia nhom chung",
+    "matching_criteria": "Tieu chi ghep cap",
+    "search_strategy": "Chien luoc tim kiem",
+    "databases": "Co so du lieu se tim",
+}
+
+_TASK_INSTRUCTIONS = """NHIEM VU:
+Dua tren thong tin tren, hay tao cac cau hoi de thu thap thong tin con thieu.
+- Neu co truong "VỪA GHI NHẬN", hay de cap trong message rang minh da ghi nhan duoc (VD: "Mình đã ghi nhận X câu trả lời...").
+- Neu co truong "CAN LAM RO LAI", hay dat cau hoi lai chi ve truong do.
+- Uu tien cac thong tin QUAN TRONG NHAT (toi da 4 truong).
+- Cau hoi phai cu the, tiep noi nguyen vong nguoi dung.
+
+TUYET DOI QUAN TRONG - "attribute_name" trong moi form_field PHAI la mot trong nhung gia tri chinh xac sau (copy nguyen, khong sua, khong them chu):
+"""
+
+_RESPONSE_FORMAT = """
+
+HAY TRA LOI BANG DINH DANG JSON DUY NHAT NAY, KHONG THEM THE MARKDOWN:
+{"message":"Noi chuyen huong de cap truong da ghi nhan (neu co) va nhung gi can lam ro them.","form_fields":[{"attribute_name":"copy chinh xac tu danh sach tren, VD: primary_endpoint","question_label":"Nhan hien thi bang tieng Viet (VD: 'Kết cục chính')","description":"Mo ta / huong dan dien","placeholder":"VD: Ty le tu vong sau 30 ngay..."}]}"""
+
+
 def get_clarification_prompt(
     missing_elements: list[str],
     current_attributes: ExtractedAttributes,
@@ -67,14 +136,8 @@ def get_clarification_prompt(
     # Build accepted / uncertain context sections
     accepted_section = ""
     if accepted_fields:
-        display_names = {
-            "population": "Đối tượng nghiên cứu", "sample_size": "Cỡ mẫu",
-            "primary_endpoint": "Kết cục chính", "intervention": "Can thiệp",
-            "comparator": "Nhóm chứng", "exposure": "Phơi nhiễm",
-            "follow_up_duration": "Thời gian theo dõi", "design_type": "Thiết kế nghiên cứu",
-        }
         lines = [
-            f"- {display_names.get(k, k.replace('_', ' '))}: \"{v}\""
+            f"- {_ACCEPTED_DISPLAY_NAMES.get(k, k.replace('_', ' '))}: \"{v}\""
             for k, v in accepted_fields.items() if v
         ]
         if lines:
@@ -93,43 +156,18 @@ def get_clarification_prompt(
     # Build the whitelist of allowed attribute_name values for the LLM
     allowed_names_list = "\n".join(f'  "{m}"' for m in missing_elements)
 
-    prompt = f"""THONG TIN DA THU THAP:
-{attrs_text if attrs_text else "Chua co thong tin nao."}
-{accepted_section}
-{uncertain_section}
-
-THONG TIN CON THIEU:
-{missing_text}
-
-{f"LICH SU HOI THOAI:{chr(10)}{history_text}" if history_text else ""}
-
-LUOT HOI DAP: {turn_number + 1}
-
-NHIEM VU:
-Dua tren thong tin tren, hay tao cac cau hoi de thu thap thong tin con thieu.
-- Neu co truong "VỪA GHI NHẬN", hay de cap trong message rang minh da ghi nhan duoc (VD: "Mình đã ghi nhận X câu trả lời...").
-- Neu co truong "CAN LAM RO LAI", hay dat cau hoi lai chi ve truong do.
-- Uu tien cac thong tin QUAN TRONG NHAT (toi da 4 truong).
-- Cau hoi phai cu the, tiep noi nguyen vong nguoi dung.
-
-TUYET DOI QUAN TRONG - "attribute_name" trong moi form_field PHAI la mot trong nhung gia tri chinh xac sau (copy nguyen, khong sua, khong them chu):
-{allowed_names_list}
-Moi form_field chi duoc dung dung mot gia tri tu danh sach tren. Khong duoc tu dat ten khac.
-
-HAY TRA LOI BANG DINH DANG JSON DUY NHAT NAY, KHONG THEM THE MARKDOWN:
-{{
-    "message": "Noi chuyen huong de cap truong da ghi nhan (neu co) va nhung gi can lam ro them.",
-    "form_fields": [
-        {{
-            "attribute_name": "copy chinh xac tu danh sach tren, VD: primary_endpoint",
-            "question_label": "Nhan hien thi bang tieng Viet (VD: 'Kết cục chính')",
-            "description": "Mo ta / huong dan dien",
-            "placeholder": "VD: Ty le tu vong sau 30 ngay..."
-        }}
+    # Optional sections are left out entirely when empty
+    sections = [
+        "THONG TIN DA THU THAP:\n" + (attrs_text or "Chua co thong tin nao.")
+        + accepted_section + uncertain_section,
+        "THONG TIN CON THIEU:\n" + missing_text,
     ]
-}}"""
+    if history_text:
+        sections.append("LICH SU HOI THOAI:\n" + history_text)
+    sections.append(f"LUOT HOI DAP: {turn_number + 1}")
+    prompt = "\n\n".join(sections) + "\n\n"
 
-    return prompt
+    return prompt + _TASK_INSTRUCTIONS + allowed_names_list + _RESPONSE_FORMAT
 
 
 def _format_attributes(attrs: ExtractedAttributes) -> str:
@@ -137,34 +175,7 @@ def _format_attributes(attrs: ExtractedAttributes) -> str:
     attr_dict = attrs.model_dump()
     lines = []
 
-    display_names = {
-        "population": "Dan so nghien cuu",
-        "sample_size": "Co mau",
-        "age_range": "Do tuoi",
-        "intervention": "Can thiep",
-        "comparator": "Doi chung",
-        "exposure": "Phoi nhiem",
-        "primary_endpoint": "Ket qua chinh",
-        "secondary_endpoints": "Ket qua phu",
-        "design_type": "Thiet ke",
-        "setting": "Dia diem",
-        "duration": "Thoi gian",
-        "follow_up_duration": "Thoi gian theo doi",
-        "case_definition": "Dinh nghia ca benh",
-        "control_definition": "Dinh nghia nhom chung",
-        "matching_criteria": "Tieu chi ghep cap",
-        "reference_standard": "Tieu chuan vang",
-        "search_strategy": "Chien luoc tim kiem",
-        "databases": "Co so du lieu",
-        "data_collection_method": "Phuong phap thu thap du lieu",
-        "randomization_method": "Phuong phap ngau nhien",
-        "blinding": "Lam mu",
-        "data_source": "Nguon du lieu",
-        "inclusion_criteria": "Tieu chuan chon",
-        "exclusion_criteria": "Tieu chuan loai",
-    }
-
-    for key, display in display_names.items():
+    for key, display in _ATTRIBUTE_DISPLAY_NAMES.items():
         value = attr_dict.get(key)
         if value:
             if hasattr(value, 'value'):  # Enum
@@ -178,26 +189,9 @@ def _format_attributes(attrs: ExtractedAttributes) -> str:
 
 def _format_missing_elements(elements: list[str]) -> str:
     """Format missing elements with explanations."""
-    explanations = {
-        "population": "Dan so nghien cuu (ai se duoc nghien cuu?)",
-        "sample_size": "Co mau (bao nhieu benh nhan?)",
-        "primary_endpoint": "Ket qua chinh (do luong gi?)",
-        "intervention": "Can thiep (lam gi cho benh nhan?)",
-        "comparator": "Nhom doi chung (so sanh voi gi?)",
-        "exposure": "Yeu to phoi nhiem (yeu to nguy co nao?)",
-        "design_type": "Thiet ke nghien cuu (RCT, cohort, cross-sectional...)",
-        "follow_up_duration": "Thoi gian theo doi",
-        "reference_standard": "Tieu chuan vang (gold standard)",
-        "case_definition": "Dinh nghia ca benh",
-        "control_definition": "Dinh nghia nhom chung",
-        "matching_criteria": "Tieu chi ghep cap",
-        "search_strategy": "Chien luoc tim kiem",
-        "databases": "Co so du lieu se tim",
-    }
-
     lines = []
     for elem in elements:
-        explanation = explanations.get(elem, elem.replace("_", " "))
+        explanation = _MISSING_EXPLANATIONS.get(elem, elem.replace("_", " "))
         lines.append(f"- {explanation}")
 
     return "\n".join(lines)
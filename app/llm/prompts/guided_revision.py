@@ -123,20 +123,11 @@ def get_guided_revision_prompt(
     # Check for pre-defined guidance
     predefined = VIOLATION_GUIDANCE.get(violation.code)
 
-    prompt = f"""VIOLATION CAN GIAI THICH:
-- Code: {violation.code}
-- Tier: {violation.tier}
-- Severity: {violation.severity.value}
-- Message: {violation.message_vi}
-- Path: {violation.path_vi}
-{f"- Context: {violation.context}" if violation.context else ""}
-
-{f"PHAN VAN BAN LIEN QUAN:{chr(10)}{section_text}" if section_text else ""}
-
----
-
-NHIEM VU:
-Hay giai thich chi tiet ve violation nay va huong dan cach sua:
+    # Shared content first, violation-specific details last: when a user
+    # asks about several violations in the same section, every prompt starts
+    # with the same prefix, which provider-side prompt caching can reuse.
+    prompt = f"""{f"PHAN VAN BAN LIEN QUAN:{chr(10)}{section_text}{chr(10)}{chr(10)}" if section_text else ""}NHIEM VU:
+Hay giai thich chi tiet ve violation duoi day va huong dan cach sua:
 
 1. GIAI THICH: Tai sao day la van de? (2-3 cau)
 
@@ -144,6 +135,16 @@ Hay giai thich chi tiet ve violation nay va huong dan cach sua:
 
 3. CACH SUA: Huong dan cu the cach viet lai (3-5 buoc)
 
+---
+
+VIOLATION CAN GIAI THICH:
+- Code: {violation.code}
+- Tier: {violation.tier}
+- Severity: {violation.severity.value}
+- Message: {violation.message_vi}
+- Path: {violation.path_vi}
+{f"- Context: {violation.context}" if violation.context else ""}
+
 {f"THAM KHAO:{chr(10)}{predefined['explanation']}" if predefined else ""}
 
 HAY TRA LOI:"""
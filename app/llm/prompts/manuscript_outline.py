@@ -5,8 +5,10 @@ Falls back to a generic template only on parse failure.
 """
 
 import re
-import json
 from typing import Optional
+
+import orjson
+
 from app.models.schemas import ResearchBlueprint, ExtractedAttributes
 from app.rules.design_rules import get_design_display_name
 
@@ -143,14 +145,17 @@ def get_manuscript_outline_prompt(
         word_limit_str = ""
         if isinstance(wl, dict):
             word_limit_str = " | ".join(f"{k}: {v}" for k, v in wl.items())
-        journal_block = f"""
-TARGET JOURNAL:
-- Name: {journal_metadata.get('name', 'Not specified')}
-- Impact Factor: {journal_metadata.get('impact_factor', 'N/A')}
-- Word limits: {word_limit_str or 'See author guidelines'}
-- Section requirements: {', '.join(journal_metadata.get('section_requirements', [])) or 'Standard IMRaD'}
-- Author guidelines: {journal_metadata.get('author_guidelines_url', 'Check journal website')}
-"""
+        # Only fields the journal record actually has — placeholders cost input tokens
+        journal_lines = [f"- Name: {journal_metadata.get('name') or 'Not specified'}"]
+        if journal_metadata.get("impact_factor"):
+            journal_lines.append(f"- Impact Factor: {journal_metadata['impact_factor']}")
+        if word_limit_str:
+            journal_lines.append(f"- Word limits: {word_limit_str}")
+        if journal_metadata.get("section_requirements"):
+            journal_lines.append(f"- Section requirements: {', '.join(journal_metadata['section_requirements'])}")
+        if journal_metadata.get("author_guidelines_url"):
+            journal_lines.append(f"- Author guidelines: {journal_metadata['author_guidelines_url']}")
+        journal_block = "\nTARGET JOURNAL:\n" + "\n".join(journal_lines) + "\n"
 
     # ── Blueprint — full context ─────────────────────────────────────────────
     dd = blueprint.design_details or {}
@@ -645,20 +650,20 @@ def parse_llm_outline_response(text: str) -> list[dict] | None:
 
     # Try direct parse first
     try:
-        data = json.loads(cleaned)
+        data = orjson.loads(cleaned)
         if isinstance(data, list) and data:
             return _validate_sections(data)
-    except (json.JSONDecodeError, ValueError):
+    except ValueError:
         pass
 
     # Try to extract JSON array via regex (handles leading/trailing prose)
     match = re.search(r"\[\s*\{.*\}\s*\]", cleaned, re.DOTALL)
     if match:
         try:
-            data = json.loads(match.group(0))
+            data = orjson.loads(match.group(0))
             if isinstance(data, list) and data:
                 return _validate_sections(data)
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
             pass
 
     return None
@@ -1,12 +1,20 @@
 """AVR Research Formation System - Main Application."""
 
+import asyncio
 import logging
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
 from app.config import get_settings
+from app.core.llm_cache import llm_cache
+from app.core.supabase_client import supabase_service
+from app.domain.search.journal_search import preload as preload_journals
+from app.llm import get_llm_client
 
 settings = get_settings()
 
@@ -19,6 +27,52 @@ logging.basicConfig(
 for _mod in ("app.core.extractor", "app.rules.design_rules", "app.api.v1.ws_chat", "app.api.v1.abstract", "app.llm.client"):
     logging.getLogger(_mod).setLevel(logging.DEBUG)
 
+logger = logging.getLogger(__name__)
+
+# Strong references to background startup work
+_startup_tasks: set[asyncio.Task] = set()
+
+
+async def _prewarm_supabase():
+    """Create Supabase clients and open the HTTP/TLS pool before the first request."""
+    if not settings.supabase_url:
+        return
+    try:
+        await supabase_service.connect()
+        admin = await supabase_service.get_admin()
+        await admin.table("research_sessions").select("id").limit(1).execute()
+        logger.info("Supabase clients pre-warmed")
+    except Exception as e:
+        # Never block startup on the database; requests will retry lazily
+        logger.warning("Supabase pre-warm failed: %s", e)
+
+
+async def _prewarm_llm():
+    """Open LLM provider connections so the first request skips the TLS handshake."""
+    try:
+        await get_llm_client().warmup()
+    except Exception as e:
+        logger.warning("LLM pre-warm failed: %s", e)
+
+
+def _prewarm_journals():
+    """Load the journal index and embedding model in the background."""
+    # Model loading takes seconds; don't hold up startup or the event loop
+    task = asyncio.create_task(asyncio.to_thread(preload_journals))
+    _startup_tasks.add(task)
+    task.add_done_callback(_startup_tasks.discard)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-warm connections on startup (unless disabled); close the LLM pool on shutdown."""
+    if settings.prewarm_on_startup:
+        await asyncio.gather(_prewarm_supabase(), _prewarm_llm())
+        _prewarm_journals()
+    yield
+    await get_llm_client().close()
+
+
 app = FastAPI(
     title="AVR Research Formation System",
     description=(
@@ -30,46 +84,61 @@ app = FastAPI(
     ),
     version="2.2.0",
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
-# CORS
+# CORS — bounded origins/methods so browsers can cache preflights. Never a
+# wildcard: credentials are allowed, so "*" would echo any caller's Origin.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "https://avr-app-9c203.web.app",
-        "https://avr-app-9c203.firebaseapp.com",
-        "http://localhost:5173",
-    ],
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    max_age=settings.cors_max_age,
 )
 
 # Routes
 app.include_router(api_router, prefix="/api/v1")
 
-
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "version": "2.2.0"}
 
 
-@app.get("/debug/config")
+_debug_config: Optional[dict] = None
+
+
+@app.get("/debug/config", include_in_schema=False)
 async def debug_config():
-    """Debug endpoint to check configuration."""
-    return {
-        "app_env": settings.app_env,
-        "default_provider": settings.default_provider,
-        "google_configured": settings.google_api_key is not None,
-        "google_model": settings.google_model,
-        "openrouter_configured": settings.openrouter_api_key is not None,
-        "anthropic_configured": settings.anthropic_api_key is not None,
-        "openai_configured": settings.openai_api_key is not None,
-        "supabase_configured": settings.supabase_url is not None,
-        "chroma_db_path": settings.chroma_db_path,
-        "embedding_model": settings.embedding_model,
-    }
+    """Debug endpoint to check configuration (only exposed when settings.debug)."""
+    global _debug_config
+    if not settings.debug:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if _debug_config is None:
+        # Settings are cached for the process lifetime, so build the body once
+        _debug_config = {
+            "app_env": settings.app_env,
+            "default_provider": settings.default_provider,
+            "google_configured": settings.google_api_key is not None,
+            "google_model": settings.google_model,
+            "openrouter_configured": settings.openrouter_api_key is not None,
+            "anthropic_configured": settings.anthropic_api_key is not None,
+            "openai_configured": settings.openai_api_key is not None,
+            "supabase_configured": settings.supabase_url is not None,
+            "chroma_db_path": settings.chroma_db_path,
+            "embedding_model": settings.embedding_model,
+        }
+    return _debug_config
+
+
+@app.get("/debug/llm-cache", include_in_schema=False)
+async def debug_llm_cache():
+    """LLM response cache hit/miss counters (only exposed when settings.debug)."""
+    if not settings.debug:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return llm_cache.get_stats()
 
 
 @app.get("/")
@@ -73,6 +73,74 @@ SECTION_NAMES_VI = {
 }
 
 
+def _compile_any(patterns: list[str], flags: int = 0) -> re.Pattern:
+    """Combine patterns into one alternation so text is scanned once, not per pattern."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+# Map of section -> keywords to detect
+SECTION_KEYWORDS = {
+    "objective": ["muc tieu", "objective", "aim", "nham", "purpose"],
+    "population": ["benh nhan", "patient", "doi tuong", "subject", "participant"],
+    "intervention": ["can thiep", "intervention", "treatment", "dieu tri"],
+    "comparator": ["doi chung", "control", "placebo", "comparator", "so sanh voi"],
+    "primary_outcome": ["ket qua chinh", "primary outcome", "primary endpoint"],
+    "randomization": ["ngau nhien", "random", "allocation"],
+    "sample_size": [r"n\s*=\s*\d+", r"\d+\s*(benh nhan|patient|ca|case)"],
+    "exposure": ["phoi nhiem", "exposure", "risk factor", "yeu to nguy co"],
+    "follow_up": ["theo doi", "follow-?up", "thang", "nam"],
+    "data_source": ["ho so", "record", "database", "du lieu"],
+    "case_definition": ["dinh nghia ca", "case definition"],
+    "control_definition": ["dinh nghia chung", "control definition"],
+    "matching": ["ghep cap", "match"],
+    "index_test": ["test", "xet nghiem", "chan doan"],
+    "reference_standard": ["tieu chuan vang", "reference", "gold standard"],
+    "search_strategy": ["tim kiem", "search", "query"],
+    "databases": ["pubmed", "embase", "cochrane", "co so du lieu"],
+    "inclusion_criteria": ["tieu chi", "criteria", "eligible"],
+    "quality_assessment": ["chat luong", "quality", "risk of bias"],
+    "statistical_method": ["thong ke", "meta", "pooled", "gop"],
+}
+
+_SECTION_PATTERNS = {
+    section: _compile_any(keywords, re.IGNORECASE)
+    for section, keywords in SECTION_KEYWORDS.items()
+}
+
+# Structural signals for the S-xx section checks
+_OBJECTIVE_RE = _compile_any([
+    r"(muc tieu|objective|aim|purpose|goal)",
+    r"(nghien cuu nay nham|this study aims)",
+    r"(de xac dinh|to determine|to evaluate|to assess)",
+    r"(chung toi|we) (nghien cuu|studied|investigated|examined)",
+])
+
+_METHODS_RE = _compile_any([
+    r"(phuong phap|method|material)",
+    r"(thiet ke|design|study design)",
+    r"(thu thap|collected|recruited)",
+    r"(phan tich|analyzed|analysis)",
+    r"(nghien cuu (cat ngang|thuan tap|hoi cu))",
+    r"(rct|randomized|cohort|cross-?sectional|case-?control)",
+])
+
+_RESULTS_RE = _compile_any([
+    r"(ket qua|result)",
+    r"\[placeholder",
+    r"(chung toi|we) (tim thay|found|observed)",
+    r"(cho thay|showed|demonstrated)",
+    r"(p\s*[<>=]\s*0\.\d+)",
+    r"(\d+%|\d+\.\d+%)",
+])
+
+_CONCLUSION_RE = _compile_any([
+    r"(ket luan|conclusion)",
+    r"(tom lai|in summary|in conclusion)",
+    r"(nghien cuu nay cho thay|this study (shows|suggests|demonstrates))",
+    r"(chung toi ket luan|we conclude)",
+])
+
+
 def check_tier1_violations(
     abstract: str,
     blueprint: Optional[ResearchBlueprint] = None,
@@ -183,42 +251,16 @@ def _check_missing_sections(
     missing = []
     abstract_lower = abstract.lower() if abstract else ""
 
-    # Map of section -> keywords to detect
-    section_keywords = {
-        "objective": ["muc tieu", "objective", "aim", "nham", "purpose"],
-        "population": ["benh nhan", "patient", "doi tuong", "subject", "participant"],
-        "intervention": ["can thiep", "intervention", "treatment", "dieu tri"],
-        "comparator": ["doi chung", "control", "placebo", "comparator", "so sanh voi"],
-        "primary_outcome": ["ket qua chinh", "primary outcome", "primary endpoint"],
-        "randomization": ["ngau nhien", "random", "allocation"],
-        "sample_size": [r"n\s*=\s*\d+", r"\d+\s*(benh nhan|patient|ca|case)"],
-        "exposure": ["phoi nhiem", "exposure", "risk factor", "yeu to nguy co"],
-        "follow_up": ["theo doi", "follow-?up", "thang", "nam"],
-        "data_source": ["ho so", "record", "database", "du lieu"],
-        "case_definition": ["dinh nghia ca", "case definition"],
-        "control_definition": ["dinh nghia chung", "control definition"],
-        "matching": ["ghep cap", "match"],
-        "index_test": ["test", "xet nghiem", "chan doan"],
-        "reference_standard": ["tieu chuan vang", "reference", "gold standard"],
-        "search_strategy": ["tim kiem", "search", "query"],
-        "databases": ["pubmed", "embase", "cochrane", "co so du lieu"],
-        "inclusion_criteria": ["tieu chi", "criteria", "eligible"],
-        "quality_assessment": ["chat luong", "quality", "risk of bias"],
-        "statistical_method": ["thong ke", "meta", "pooled", "gop"],
-    }
+    blueprint_dict = None
+    if blueprint:
+        blueprint_dict = blueprint.model_dump() if hasattr(blueprint, 'model_dump') else blueprint
 
     for section in required:
-        keywords = section_keywords.get(section, [section])
-        found = False
-
-        for keyword in keywords:
-            if re.search(keyword, abstract_lower, re.IGNORECASE):
-                found = True
-                break
+        pattern = _SECTION_PATTERNS.get(section) or _compile_any([section], re.IGNORECASE)
+        found = bool(pattern.search(abstract_lower))
 
         # Also check blueprint if available
-        if blueprint and not found:
-            blueprint_dict = blueprint.model_dump() if hasattr(blueprint, 'model_dump') else blueprint
+        if blueprint_dict and not found:
             if section in blueprint_dict and blueprint_dict[section]:
                 found = True
 
@@ -230,51 +272,19 @@ def _check_missing_sections(
 
 def _has_objective(abstract: str) -> bool:
     """Check if abstract has a clear objective."""
-    patterns = [
-        r"(muc tieu|objective|aim|purpose|goal)",
-        r"(nghien cuu nay nham|this study aims)",
-        r"(de xac dinh|to determine|to evaluate|to assess)",
-        r"(chung toi|we) (nghien cuu|studied|investigated|examined)",
-    ]
-    abstract_lower = abstract.lower()
-    return any(re.search(p, abstract_lower) for p in patterns)
+    return bool(_OBJECTIVE_RE.search(abstract.lower()))
 
 
 def _has_methods(abstract: str) -> bool:
     """Check if abstract has methods section."""
-    patterns = [
-        r"(phuong phap|method|material)",
-        r"(thiet ke|design|study design)",
-        r"(thu thap|collected|recruited)",
-        r"(phan tich|analyzed|analysis)",
-        r"(nghien cuu (cat ngang|thuan tap|hoi cu))",
-        r"(rct|randomized|cohort|cross-?sectional|case-?control)",
-    ]
-    abstract_lower = abstract.lower()
-    return any(re.search(p, abstract_lower) for p in patterns)
+    return bool(_METHODS_RE.search(abstract.lower()))
 
 
 def _has_results_section(abstract: str) -> bool:
     """Check if abstract has results section or placeholder."""
-    patterns = [
-        r"(ket qua|result)",
-        r"\[placeholder",
-        r"(chung toi|we) (tim thay|found|observed)",
-        r"(cho thay|showed|demonstrated)",
-        r"(p\s*[<>=]\s*0\.\d+)",
-        r"(\d+%|\d+\.\d+%)",
-    ]
-    abstract_lower = abstract.lower()
-    return any(re.search(p, abstract_lower) for p in patterns)
+    return bool(_RESULTS_RE.search(abstract.lower()))
 
 
 def _has_conclusion(abstract: str) -> bool:
     """Check if abstract has conclusion."""
-    patterns = [
-        r"(ket luan|conclusion)",
-        r"(tom lai|in summary|in conclusion)",
-        r"(nghien cuu nay cho thay|this study (shows|suggests|demonstrates))",
-        r"(chung toi ket luan|we conclude)",
-    ]
-    abstract_lower = abstract.lower()
-    return any(re.search(p, abstract_lower) for p in patterns)
+    return bool(_CONCLUSION_RE.search(abstract.lower()))
@@ -369,25 +369,28 @@ def check_design_completeness(
     return len(missing) == 0, missing
 
 
+# Vietnamese display names, shared by every call
+DESIGN_DISPLAY_NAMES = {
+    DesignType.RCT: "Thu nghiem lam sang ngau nhien co doi chung (RCT)",
+    DesignType.QUASI_EXPERIMENTAL: "Nghien cuu can thiep khong ngau nhien",
+    DesignType.BEFORE_AFTER: "Nghien cuu truoc-sau",
+    DesignType.COHORT_PROSPECTIVE: "Nghien cuu thuan tap tien cu",
+    DesignType.COHORT_RETROSPECTIVE: "Nghien cuu thuan tap hoi cu",
+    DesignType.CASE_CONTROL: "Nghien cuu benh-chung",
+    DesignType.CROSS_SECTIONAL: "Nghien cuu cat ngang",
+    DesignType.CASE_SERIES: "Bao cao loat ca",
+    DesignType.CASE_REPORT: "Bao cao ca benh",
+    DesignType.DIAGNOSTIC_ACCURACY: "Nghien cuu do chinh xac chan doan",
+    DesignType.PROGNOSTIC: "Nghien cuu tien luong",
+    DesignType.SYSTEMATIC_REVIEW: "Tong quan he thong",
+    DesignType.META_ANALYSIS: "Phan tich gop",
+    DesignType.SCOPING_REVIEW: "Tong quan pham vi",
+    DesignType.QUALITATIVE: "Nghien cuu dinh tinh",
+    DesignType.MIXED_METHODS: "Nghien cuu ket hop",
+    DesignType.UNKNOWN: "Chua xac dinh",
+}
+
+
 def get_design_display_name(design_type: DesignType) -> str:
     """Get Vietnamese display name for design type."""
-    display_names = {
-        DesignType.RCT: "Thu nghiem lam sang ngau nhien co doi chung (RCT)",
-        DesignType.QUASI_EXPERIMENTAL: "Nghien cuu can thiep khong ngau nhien",
-        DesignType.BEFORE_AFTER: "Nghien cuu truoc-sau",
-        DesignType.COHORT_PROSPECTIVE: "Nghien cuu thuan tap tien cu",
-        DesignType.COHORT_RETROSPECTIVE: "Nghien cuu thuan tap hoi cu",
-        DesignType.CASE_CONTROL: "Nghien cuu benh-chung",
-        DesignType.CROSS_SECTIONAL: "Nghien cuu cat ngang",
-        DesignType.CASE_SERIES: "Bao cao loat ca",
-        DesignType.CASE_REPORT: "Bao cao ca benh",
-        DesignType.DIAGNOSTIC_ACCURACY: "Nghien cuu do chinh xac chan doan",
-        DesignType.PROGNOSTIC: "Nghien cuu tien luong",
-        DesignType.SYSTEMATIC_REVIEW: "Tong quan he thong",
-        DesignType.META_ANALYSIS: "Phan tich gop",
-        DesignType.SCOPING_REVIEW: "Tong quan pham vi",
-        DesignType.QUALITATIVE: "Nghien cuu dinh tinh",
-        DesignType.MIXED_METHODS: "Nghien cuu ket hop",
-        DesignType.UNKNOWN: "Chua xac dinh",
-    }
-    return display_names.get(design_type, str(design_type.value))
+    return DESIGN_DISPLAY_NAMES.get(design_type, str(design_type.value))
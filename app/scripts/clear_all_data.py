@@ -4,16 +4,21 @@ import asyncio
 from supabase import create_async_client
 from app.config import get_settings
 
+# Concurrent auth admin calls, kept low to stay under the API rate limit
+MAX_CONCURRENT_DELETES = 5
+
 
 async def clear_all():
     settings = get_settings()
     admin = await create_async_client(settings.supabase_url, settings.supabase_secret_key)
 
-    print("Deleting conversation_turns...")
-    await admin.table("conversation_turns").delete().neq("id", 0).execute()
-
-    print("Deleting violations...")
-    await admin.table("violations").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
+    # Turns and violations both hang off research_sessions but not each
+    # other, so they are cleared in one round trip
+    print("Deleting conversation_turns and violations...")
+    await asyncio.gather(
+        admin.table("conversation_turns").delete().neq("id", 0).execute(),
+        admin.table("violations").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute(),
+    )
 
     print("Deleting research_sessions...")
     await admin.table("research_sessions").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
@@ -26,13 +31,27 @@ async def clear_all():
     users = response if isinstance(response, list) else getattr(response, "users", [])
 
     print(f"Deleting {len(users)} auth users...")
-    for user in users:
-        uid = user.id if hasattr(user, "id") else user["id"]
-        await admin.auth.admin.delete_user(uid)
-        print(f"  Deleted user: {uid}")
+    uids = [user.id if hasattr(user, "id") else user["id"] for user in users]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+
+    async def delete_user(uid):
+        async with semaphore:
+            await admin.auth.admin.delete_user(uid)
+
+    outcomes = await asyncio.gather(*(delete_user(uid) for uid in uids), return_exceptions=True)
+    for uid, outcome in zip(uids, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"  Failed to delete user {uid}: {outcome}")
+        else:
+            print(f"  Deleted user: {uid}")
 
     print("Done. All data cleared.")
 
 
 if __name__ == "__main__":
-    asyncio.run(clear_all())
+    try:
+        from uvloop import run  # ships with uvicorn[standard]
+    except ImportError:
+        from asyncio import run
+
+    run(clear_all())
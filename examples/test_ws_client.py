@@ -2,173 +2,269 @@
 Example WebSocket client for testing realtime Topic Analyzer.
 
 Usage:
-    python examples/test_ws_client.py
+    python examples/test_ws_client.py [--simulate-typing] [--interactive]
 """
 
+import argparse
 import asyncio
 import json
+import sys
 
 import websockets
 
+# Seconds of silence before the server is considered hung. Each frame
+# (including agent_thinking) restarts the wait, so slow-but-steady
+# analyses don't trip it.
+RECV_TIMEOUT = 30
 
-async def test_topic_analyzer():
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
+
+def _dumps(obj, pretty: bool = False) -> str:
+    # Text frames: the server reads with receive_text()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    return json.dumps(obj, indent=2 if pretty else None)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+ABSTRACT = """
+A study investigating machine learning techniques for predicting
+patient outcomes in cardiovascular disease.
+"""
+
+# Static first frame, encoded once at import
+INITIAL_MESSAGE = _dumps({
+    "type": "user_message",
+    "abstract": ABSTRACT.strip(),
+    "language": "en",
+})
+
+
+# ══════════════════════════════════════════════════════════════
+# Message handlers
+#
+# Each takes (data, ctx) and returns True when the session is over.
+# ctx holds the websocket, session_id, clarification_questions,
+# simulate_typing, interactive and the buffered status lines.
+# ══════════════════════════════════════════════════════════════
+
+def _status(ctx: dict, line: str):
+    """Print a high-frequency status line, buffered unless interactive."""
+    if ctx["interactive"]:
+        print(line)
+    else:
+        ctx["status_lines"].append(line)
+
+
+def _flush_status(ctx: dict):
+    """Write buffered status lines in one call, before any other output."""
+    if ctx["status_lines"]:
+        sys.stdout.write("\n".join(ctx["status_lines"]) + "\n")
+        ctx["status_lines"].clear()
+
+
+async def _on_session_started(data: dict, ctx: dict) -> bool:
+    _flush_status(ctx)
+    ctx["session_id"] = data.get("session_id")
+    print(f"🎯 Session started: {ctx['session_id']}\n")
+    return False
+
+
+async def _on_agent_thinking(data: dict, ctx: dict) -> bool:
+    """Status updates."""
+    get = data.get
+    message_text, step, progress = get("message"), get("step"), get("progress")
+    _status(ctx, f"💭 [{progress}%] {message_text} ({step})")
+    return False
+
+
+async def _on_clarification_needed(data: dict, ctx: dict) -> bool:
+    _flush_status(ctx)
+    print("\n❓ Clarification needed:")
+    print(f"   {data.get('intro_message')}\n")
+
+    questions = data.get("questions", [])
+    ctx["clarification_questions"] = questions
+
+    for i, q in enumerate(questions, 1):
+        print(f"   {i}. [{q['element']}] {q['question']}")
+        print(f"      Priority: {q['priority']}")
+
+    print("\n📝 Answering questions...")
+
+    # Send answers (simulated); frames are encoded up front so
+    # the send loop only waits on the socket
+    frames = [
+        _dumps({
+            "type": "user_answer",
+            "question_id": q["id"],
+            "answer": f"This is a simulated answer for {q['element']}",
+            "session_id": ctx["session_id"],
+        })
+        for q in questions
+    ]
+    for frame in frames:
+        await ctx["websocket"].send(frame)
+        if ctx["simulate_typing"]:
+            await asyncio.sleep(0.5)
+    return False
+
+
+async def _on_analysis_progress(data: dict, ctx: dict) -> bool:
+    get = data.get
+    step, message_text, progress, partial = (
+        get("step"), get("message"), get("progress"), get("partial_result")
+    )
+
+    _status(ctx, f"\n🔬 [{progress}%] {step.upper()}: {message_text}")
+
+    if partial:
+        _status(ctx, f"   Partial result: {_dumps(partial, pretty=True)}")
+    return False
+
+
+async def _on_analysis_complete(data: dict, ctx: dict) -> bool:
+    _flush_status(ctx)
+    print("\n✨ Analysis complete!\n")
+
+    result = data.get("result", {})
+    processing_time = data.get("processing_time_seconds")
+    get = result.get
+    novelty, pub = get("novelty", {}), get("publishability", {})
+    gaps, suggestions = get("gaps", []), get("suggestions", [])
+
+    print("═" * 60)
+    print("FINAL RESULTS")
+    print("═" * 60)
+
+    # Novelty
+    print(f"\n📊 NOVELTY SCORE: {novelty.get('score')}/100")
+    print(f"   {novelty.get('reasoning')}")
+
+    # Publishability
+    print(f"\n📈 PUBLISHABILITY: {pub.get('level')} ({pub.get('target_tier')})")
+    print(f"   Confidence: {pub.get('confidence')}")
+    print(f"   {pub.get('reasoning')}")
+
+    # Gaps
+    print(f"\n🔍 RESEARCH GAPS ({len(gaps)}):")
+    for gap in gaps[:3]:
+        print(f"   - [{gap.get('type')}] {gap.get('description')}")
+
+    # Suggestions
+    print(f"\n💡 SUGGESTIONS ({len(suggestions)}):")
+    for sug in suggestions[:3]:
+        print(f"   - {sug.get('action')} (Impact: {sug.get('impact')})")
+
+    print(f"\n⏱️  Processing time: {processing_time}s")
+    print("═" * 60)
+
+    return True  # Done!
+
+
+async def _on_error(data: dict, ctx: dict) -> bool:
+    _flush_status(ctx)
+    get = data.get
+    error, details, recoverable = get("error"), get("details"), get("recoverable")
+
+    print(f"\n❌ Error: {error}")
+    if details:
+        print(f"   Details: {details}")
+    print(f"   Recoverable: {recoverable}")
+
+    return not recoverable
+
+
+# Message type -> handler; one dict lookup per frame instead of an elif chain
+HANDLERS = {
+    "session_started": _on_session_started,
+    "agent_thinking": _on_agent_thinking,
+    "clarification_needed": _on_clarification_needed,
+    "analysis_progress": _on_analysis_progress,
+    "analysis_complete": _on_analysis_complete,
+    "error": _on_error,
+}
+
+
+async def test_topic_analyzer(simulate_typing: bool = False, interactive: bool = False):
     """Test the WebSocket topic analyzer endpoint."""
     uri = "ws://localhost:8000/api/v1/ws/topic/analyze"
 
     print("🔌 Connecting to WebSocket...")
 
-    async with websockets.connect(uri) as websocket:
+    # One connection for the whole analyze flow. permessage-deflate is off:
+    # on localhost it only costs CPU on both ends. max_size=None lets the
+    # analysis_complete result tree exceed the 1 MiB default, and no
+    # keepalive pings compete with recv() during long analysis steps.
+    async with websockets.connect(
+        uri, compression=None, max_size=None, ping_interval=None
+    ) as websocket:
         print("✅ Connected!\n")
 
         # ══════════════════════════════════════════════════════════
         # Step 1: Send initial abstract
         # ══════════════════════════════════════════════════════════
-        abstract = """
-        A study investigating machine learning techniques for predicting
-        patient outcomes in cardiovascular disease.
-        """
-
-        initial_message = {
-            "type": "user_message",
-            "abstract": abstract.strip(),
-            "language": "en",
-        }
-
         print("📤 Sending abstract...")
-        await websocket.send(json.dumps(initial_message))
+        await websocket.send(INITIAL_MESSAGE)
 
         # ══════════════════════════════════════════════════════════
         # Step 2: Listen for messages
         # ══════════════════════════════════════════════════════════
-        session_id = None
-        clarification_questions = []
+        ctx = {
+            "websocket": websocket,
+            "session_id": None,
+            "clarification_questions": [],
+            "simulate_typing": simulate_typing,
+            "interactive": interactive,
+            "status_lines": [],
+        }
 
         while True:
             try:
-                message = await websocket.recv()
-                data = json.loads(message)
-                msg_type = data.get("type")
-
-                # ──────────────────────────────────────────────────
-                # Session Started
-                # ──────────────────────────────────────────────────
-                if msg_type == "session_started":
-                    session_id = data.get("session_id")
-                    print(f"🎯 Session started: {session_id}\n")
-
-                # ──────────────────────────────────────────────────
-                # Agent Thinking (Status Updates)
-                # ──────────────────────────────────────────────────
-                elif msg_type == "agent_thinking":
-                    message_text = data.get("message")
-                    step = data.get("step")
-                    progress = data.get("progress")
-                    print(f"💭 [{progress}%] {message_text} ({step})")
-
-                # ──────────────────────────────────────────────────
-                # Clarification Needed
-                # ──────────────────────────────────────────────────
-                elif msg_type == "clarification_needed":
-                    print("\n❓ Clarification needed:")
-                    print(f"   {data.get('intro_message')}\n")
-
-                    questions = data.get("questions", [])
-                    clarification_questions = questions
-
-                    for i, q in enumerate(questions, 1):
-                        print(f"   {i}. [{q['element']}] {q['question']}")
-                        print(f"      Priority: {q['priority']}")
-
-                    print("\n📝 Answering questions...")
-
-                    # Send answers (simulated)
-                    for q in questions:
-                        answer = {
-                            "type": "user_answer",
-                            "question_id": q["id"],
-                            "answer": f"This is a simulated answer for {q['element']}",
-                            "session_id": session_id,
-                        }
-                        await websocket.send(json.dumps(answer))
-                        await asyncio.sleep(0.5)  # Simulate user typing
-
-                # ──────────────────────────────────────────────────
-                # Analysis Progress
-                # ──────────────────────────────────────────────────
-                elif msg_type == "analysis_progress":
-                    step = data.get("step")
-                    message_text = data.get("message")
-                    progress = data.get("progress")
-                    partial = data.get("partial_result")
-
-                    print(f"\n🔬 [{progress}%] {step.upper()}: {message_text}")
-
-                    if partial:
-                        print(f"   Partial result: {json.dumps(partial, indent=2)}")
-
-                # ──────────────────────────────────────────────────
-                # Analysis Complete
-                # ──────────────────────────────────────────────────
-                elif msg_type == "analysis_complete":
-                    print("\n✨ Analysis complete!\n")
-
-                    result = data.get("result", {})
-                    processing_time = data.get("processing_time_seconds")
-
-                    print("═" * 60)
-                    print("FINAL RESULTS")
-                    print("═" * 60)
-
-                    # Novelty
-                    novelty = result.get("novelty", {})
-                    print(f"\n📊 NOVELTY SCORE: {novelty.get('score')}/100")
-                    print(f"   {novelty.get('reasoning')}")
-
-                    # Publishability
-                    pub = result.get("publishability", {})
-                    print(f"\n📈 PUBLISHABILITY: {pub.get('level')} ({pub.get('target_tier')})")
-                    print(f"   Confidence: {pub.get('confidence')}")
-                    print(f"   {pub.get('reasoning')}")
-
-                    # Gaps
-                    gaps = result.get("gaps", [])
-                    print(f"\n🔍 RESEARCH GAPS ({len(gaps)}):")
-                    for gap in gaps[:3]:
-                        print(f"   - [{gap.get('type')}] {gap.get('description')}")
-
-                    # Suggestions
-                    suggestions = result.get("suggestions", [])
-                    print(f"\n💡 SUGGESTIONS ({len(suggestions)}):")
-                    for sug in suggestions[:3]:
-                        print(f"   - {sug.get('action')} (Impact: {sug.get('impact')})")
-
-                    print(f"\n⏱️  Processing time: {processing_time}s")
-                    print("═" * 60)
-
-                    break  # Done!
-
-                # ──────────────────────────────────────────────────
-                # Error
-                # ──────────────────────────────────────────────────
-                elif msg_type == "error":
-                    error = data.get("error")
-                    details = data.get("details")
-                    recoverable = data.get("recoverable")
-
-                    print(f"\n❌ Error: {error}")
-                    if details:
-                        print(f"   Details: {details}")
-                    print(f"   Recoverable: {recoverable}")
-
-                    if not recoverable:
-                        break
+                message = await asyncio.wait_for(websocket.recv(), timeout=RECV_TIMEOUT)
+                data = _loads(message)
+                handler = HANDLERS.get(data.get("type"))
+                if handler and await handler(data, ctx):
+                    break
+
+            except asyncio.TimeoutError:
+                _flush_status(ctx)
+                print(f"\n⏰ No message from server for {RECV_TIMEOUT}s — giving up")
+                break
 
             except websockets.exceptions.ConnectionClosed:
+                _flush_status(ctx)
                 print("\n🔌 Connection closed")
                 break
 
+        _flush_status(ctx)
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Topic Analyzer WebSocket test client")
+    parser.add_argument(
+        "--simulate-typing",
+        action="store_true",
+        help="pause 0.5s between answers like a user typing (off for timing runs)",
+    )
+    parser.add_argument(
+        "--interactive",
+        action="store_true",
+        help="print status frames as they arrive instead of buffering them",
+    )
+    args = parser.parse_args()
+
+    try:
+        from uvloop import run  # ships with uvicorn[standard]
+    except ImportError:
+        from asyncio import run
+
     print("""
 ╔═══════════════════════════════════════════════════════════╗
 ║  AVR Topic Analyzer - WebSocket Test Client              ║
@@ -176,7 +272,10 @@ if __name__ == "__main__":
     """)
 
     try:
-        asyncio.run(test_topic_analyzer())
+        run(test_topic_analyzer(
+            simulate_typing=args.simulate_typing,
+            interactive=args.interactive,
+        ))
     except KeyboardInterrupt:
         print("\n\n👋 Interrupted by user")
     except Exception as e:
@@ -2,12 +2,21 @@
 """
 Diagnostic script to test each step of the Topic Analyzer pipeline.
 This script times each function call to identify bottlenecks.
+
+Steps run one at a time by default so each timing is measured in isolation.
+Pass --concurrent to run independent steps together and measure wall clock.
 """
 
+import argparse
 import asyncio
 import time
 import sys
 
+# Imported once up front so @timed measures the calls, not import machinery.
+# The skill functions are imported inside their steps: app.skills is not in
+# this tree, and @timed reports a failed import as that step's error.
+from app.llm.llm_router import llm_router
+
 # Test timeout in seconds (30s as threshold)
 TIMEOUT = 30
 
@@ -36,72 +45,47 @@ def timed(name):
     return decorator
 
 
-async def main():
+async def main(concurrent: bool = False):
     print("=" * 60)
     print("🔍 TOPIC ANALYZER PIPELINE DIAGNOSTIC")
     print("=" * 60)
     print(f"Timeout per step: {TIMEOUT}s")
+    print(f"Mode: {'concurrent' if concurrent else 'sequential'}")
     
     # Test abstract
     abstract = """This study investigates a novel deep learning algorithm for lung cancer detection from CT scans. We collected 5,000 CT images from Cho Ray Hospital, Vietnam (2020-2023). Our CNN achieved 94.5% sensitivity and 92.3% specificity."""
     
     results = {}
+    wall_start = time.time()
     
     # Test 1: LLM Router basic call
     @timed("Step 0: LLM Router Basic")
     async def test_llm_basic():
-        from app.core.llm_router import llm_router
         return await llm_router.call("Say 'OK'", json_output=False)
     
-    results["llm_basic"], _, _ = await test_llm_basic()
-    
     # Test 2: LLM Router JSON call
     @timed("Step 1: LLM Router JSON")
     async def test_llm_json():
-        from app.core.llm_router import llm_router
         return await llm_router.call('{"test": true}', json_output=False)
     
-    results["llm_json"], _, _ = await test_llm_json()
-    
     # Test 3: assess_completeness
     @timed("Step 2: assess_completeness")
     async def test_assess():
         from app.skills.input_clarifier.functions import assess_completeness
         return await assess_completeness(abstract)
     
-    results["assess"], time_assess, err = await test_assess()
-    
-    if err:
-        print(f"\n⚠️  Stopping at assess_completeness due to: {err}")
-        print_summary(results)
-        return
-    
     # Test 4: score_novelty
     @timed("Step 3: score_novelty")
     async def test_novelty():
         from app.skills.topic_analyzer.functions import score_novelty
         return await score_novelty(abstract)
     
-    results["novelty"], _, err = await test_novelty()
-    
-    if err:
-        print(f"\n⚠️  Stopping at score_novelty due to: {err}")
-        print_summary(results)
-        return
-    
     # Test 5: analyze_gaps
     @timed("Step 4: analyze_gaps")
     async def test_gaps():
         from app.skills.topic_analyzer.functions import analyze_gaps
         return await analyze_gaps(abstract)
     
-    results["gaps"], _, err = await test_gaps()
-    
-    if err:
-        print(f"\n⚠️  Stopping at analyze_gaps due to: {err}")
-        print_summary(results)
-        return
-    
     # Test 6: perform_swot
     @timed("Step 5: perform_swot")
     async def test_swot():
@@ -109,13 +93,6 @@ async def main():
         novelty_score = results["novelty"].get("novelty_score", 50) if results["novelty"] else 50
         return await perform_swot(abstract, novelty_score, 0, "Q2")
     
-    results["swot"], _, err = await test_swot()
-    
-    if err:
-        print(f"\n⚠️  Stopping at perform_swot due to: {err}")
-        print_summary(results)
-        return
-    
     # Test 7: predict_publishability
     @timed("Step 6: predict_publishability")
     async def test_publish():
@@ -126,13 +103,6 @@ async def main():
         weaknesses = results["swot"].get("weaknesses", []) if results["swot"] else []
         return await predict_publishability(abstract, novelty_score, gaps, strengths, weaknesses)
     
-    results["publish"], _, err = await test_publish()
-    
-    if err:
-        print(f"\n⚠️  Stopping at predict_publishability due to: {err}")
-        print_summary(results)
-        return
-    
     # Test 8: suggest_improvements
     @timed("Step 7: suggest_improvements")
     async def test_suggest():
@@ -142,8 +112,41 @@ async def main():
         target_tier = results["publish"].get("target_tier", "Q2") if results["publish"] else "Q2"
         return await suggest_improvements(abstract, novelty_score, weaknesses, target_tier)
     
-    results["suggest"], _, _ = await test_suggest()
-    
+    # Steps grouped as a dependency DAG. With --concurrent, independent steps
+    # share one gather, so each stage costs max() of its steps rather than sum()
+    stages = [
+        # Smoke tests and completeness only need the abstract
+        {"llm_basic": test_llm_basic, "llm_json": test_llm_json, "assess": test_assess},
+        # Novelty and gaps both only need the abstract
+        {"novelty": test_novelty, "gaps": test_gaps},
+        {"swot": test_swot},
+        {"publish": test_publish},
+        {"suggest": test_suggest},
+    ]
+    # Stop the pipeline if these fail; the smoke tests are informational
+    required = {"assess", "novelty", "gaps", "swot", "publish"}
+    
+    step_total = 0.0
+    for stage in stages:
+        if concurrent:
+            outcomes = await asyncio.gather(*(test() for test in stage.values()))
+        else:
+            outcomes = []
+            for key, test in stage.items():
+                outcomes.append(await test())
+                if outcomes[-1][2] and key in required:
+                    break
+        for key, (result, elapsed, err) in zip(stage, outcomes):
+            results[key] = result
+            step_total += elapsed
+        failed = [(key, err) for key, (_, _, err) in zip(stage, outcomes) if err and key in required]
+        if failed:
+            key, err = failed[0]
+            print(f"\n⚠️  Stopping at {key} due to: {err}")
+            break
+    
+    wall = time.time() - wall_start
+    print(f"\n⏱️  Wall clock: {wall:.2f}s (sum of steps: {step_total:.2f}s)")
     print_summary(results)
 
 
@@ -158,4 +161,16 @@ def print_summary(results):
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--concurrent", action="store_true",
+        help="run independent steps concurrently (timings then include contention)",
+    )
+    args = parser.parse_args()
+
+    try:
+        from uvloop import run  # ships with uvicorn[standard]
+    except ImportError:
+        from asyncio import run
+
+    run(main(args.concurrent))
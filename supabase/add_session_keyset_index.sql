@@ -0,0 +1,10 @@
+-- ════════════════════════════════════════════════════════════════════════════
+-- UPDATE: Keyset pagination index for GET /session/ (session list)
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/_/sql
+-- ════════════════════════════════════════════════════════════════════════════
+
+-- get_user_sessions pages on (updated_at, id) instead of OFFSET, so the index
+-- must include id as a tie-breaker to keep every page an index range scan.
+DROP INDEX IF EXISTS idx_research_sessions_user_updated;
+CREATE INDEX IF NOT EXISTS idx_research_sessions_user_updated
+    ON research_sessions(user_id, updated_at DESC, id DESC);
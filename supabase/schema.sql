@@ -101,8 +101,9 @@ CREATE TABLE IF NOT EXISTS research_sessions (
 
 CREATE INDEX IF NOT EXISTS idx_research_sessions_user_id
     ON research_sessions(user_id);
+-- Keyset pagination for session lists: (updated_at, id) cursor per user
 CREATE INDEX IF NOT EXISTS idx_research_sessions_user_updated
-    ON research_sessions(user_id, updated_at DESC);
+    ON research_sessions(user_id, updated_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_research_sessions_status
     ON research_sessions(status);
 CREATE INDEX IF NOT EXISTS idx_research_sessions_phase
@@ -0,0 +1,7 @@
+"""Shared pytest setup."""
+
+import os
+
+# Tests use TestClient with mocked services: skip the Supabase query, the
+# provider HEAD requests and the embedding model load at app startup.
+os.environ.setdefault("PREWARM_ON_STARTUP", "false")
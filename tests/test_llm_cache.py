@@ -0,0 +1,57 @@
+"""Unit tests for the in-process LLM response cache."""
+
+import asyncio
+from unittest.mock import patch
+
+from app.core.llm_cache import AsyncLRUTTL, make_key
+
+
+class TestMakeKey:
+    def test_same_inputs_same_key(self):
+        assert make_key("pubmed_query", "a", "b") == make_key("pubmed_query", "a", "b")
+
+    def test_namespace_and_part_boundaries_matter(self):
+        assert make_key("pubmed_query", "p") != make_key("other", "p")
+        assert make_key("ns", "ab", "c") != make_key("ns", "a", "bc")
+
+
+class TestAsyncLRUTTL:
+    def test_miss_then_hit(self):
+        cache = AsyncLRUTTL(capacity=4, ttl=60)
+
+        async def run():
+            assert await cache.get("k") is None
+            await cache.set("k", "v")
+            return await cache.get("k")
+
+        assert asyncio.run(run()) == "v"
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        cache = AsyncLRUTTL(capacity=2, ttl=60)
+
+        async def run():
+            await cache.set("a", 1)
+            await cache.set("b", 2)
+            await cache.get("a")  # "b" is now least recently used
+            await cache.set("c", 3)
+            return [await cache.get(k) for k in ("a", "b", "c")]
+
+        assert asyncio.run(run()) == [1, None, 3]
+
+    def test_entries_expire_after_ttl(self):
+        cache = AsyncLRUTTL(capacity=4, ttl=10)
+
+        async def run():
+            with patch("app.core.llm_cache.time.monotonic", return_value=100.0):
+                await cache.set("k", "v")
+            with patch("app.core.llm_cache.time.monotonic", return_value=109.0):
+                fresh = await cache.get("k")
+            with patch("app.core.llm_cache.time.monotonic", return_value=111.0):
+                expired = await cache.get("k")
+            return fresh, expired
+
+        assert asyncio.run(run()) == ("v", None)
+        assert cache.get_stats()["size"] == 0
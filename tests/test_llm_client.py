@@ -0,0 +1,120 @@
+"""Unit tests for LLMClient request coalescing and streaming fallback."""
+
+import asyncio
+import gc
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.llm.client import LLMClient, LLMResponse
+
+
+def _client(call_openrouter) -> LLMClient:
+    """LLMClient routed to OpenRouter only, with provider and usage calls mocked."""
+    client = LLMClient()
+    client.settings = SimpleNamespace(
+        default_provider="openrouter",
+        openrouter_api_key="test-key",
+        local_base_url=None,
+        google_api_key=None,
+        anthropic_api_key=None,
+        openai_api_key=None,
+    )
+    client._call_openrouter = call_openrouter
+    client._track_usage = AsyncMock()
+    return client
+
+
+def _slow_response(content: str = "OK"):
+    async def call(*_):
+        await asyncio.sleep(0.01)
+        return LLMResponse(content=content, model="m", usage={"prompt_tokens": 3, "completion_tokens": 2})
+    return AsyncMock(side_effect=call)
+
+
+class TestInflightCoalescing:
+    def test_identical_deterministic_calls_share_one_request_and_charge_each_user(self):
+        call = _slow_response()
+        client = _client(call)
+
+        async def run():
+            return await asyncio.gather(
+                client.complete("prompt", temperature=0, user_id="user-a"),
+                client.complete("prompt", temperature=0, user_id="user-b"),
+            )
+
+        a, b = asyncio.run(run())
+
+        assert call.await_count == 1
+        assert a is b
+        charged = [c.args[0] for c in client._track_usage.await_args_list]
+        assert sorted(charged) == ["user-a", "user-b"]
+        assert client._inflight == {}
+
+    def test_sampled_calls_are_not_coalesced(self):
+        call = _slow_response()
+        client = _client(call)
+
+        async def run():
+            await asyncio.gather(
+                client.complete("prompt", temperature=0.7, user_id="user-a"),
+                client.complete("prompt", temperature=0.7, user_id="user-b"),
+            )
+
+        asyncio.run(run())
+
+        assert call.await_count == 2
+
+    def test_failure_after_caller_cancelled_is_retrieved(self):
+        async def failing(*_):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+
+        client = _client(AsyncMock(side_effect=failing))
+
+        async def run():
+            unhandled = []
+            asyncio.get_running_loop().set_exception_handler(lambda _, ctx: unhandled.append(ctx))
+            caller = asyncio.create_task(client.complete("prompt", temperature=0))
+            await asyncio.sleep(0)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            await asyncio.sleep(0.05)
+            gc.collect()
+            return unhandled
+
+        assert asyncio.run(run()) == []
+        assert client._inflight == {}
+
+
+class TestStreamFallback:
+    def test_stream_failing_before_first_chunk_falls_back_to_complete(self):
+        client = _client(_slow_response("full text"))
+
+        async def broken_stream(*_):
+            raise RuntimeError("stream refused")
+            yield  # make it a generator
+
+        client._stream_openrouter = broken_stream
+
+        async def run():
+            return [chunk async for chunk in client.stream("prompt")]
+
+        assert asyncio.run(run()) == ["full text"]
+
+    def test_stream_failing_mid_way_is_raised(self):
+        client = _client(_slow_response("full text"))
+
+        async def partial_stream(*_):
+            yield "part"
+            raise RuntimeError("connection reset")
+
+        client._stream_openrouter = partial_stream
+
+        async def run():
+            return [chunk async for chunk in client.stream("prompt")]
+
+        with pytest.raises(RuntimeError, match="connection reset"):
+            asyncio.run(run())
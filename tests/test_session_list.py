@@ -0,0 +1,105 @@
+"""Tests for GET /session/ keyset pagination and its PostgREST filter."""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_user_id
+from app.core.supabase_client import SupabaseService
+from app.main import app
+
+CURSOR_ID = "0b8f7a4e-3c1d-4e5f-9a2b-6c7d8e9f0a1b"
+CURSOR_TS = "2026-01-02T03:04:05+00:00"
+
+
+def _query_mock() -> MagicMock:
+    """A PostgREST query builder whose chained calls all return itself."""
+    query = MagicMock()
+    for method in ("table", "select", "eq", "or_", "lt", "order", "limit", "range"):
+        getattr(query, method).return_value = query
+    query.execute = AsyncMock(return_value=SimpleNamespace(data=[]))
+    return query
+
+
+def _get_user_sessions(**kwargs) -> MagicMock:
+    service = SupabaseService()
+    service._admin = _query_mock()
+    asyncio.run(service.get_user_sessions(user_id="user-1", **kwargs))
+    return service._admin
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Filter construction (SupabaseService.get_user_sessions)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestKeysetFilter:
+    def test_cursor_with_id_builds_tuple_comparison(self):
+        ts = datetime.fromisoformat(CURSOR_TS)
+        query = _get_user_sessions(after_updated_at=ts, after_id=UUID(CURSOR_ID))
+
+        query.or_.assert_called_once_with(
+            f'updated_at.lt."{CURSOR_TS}",and(updated_at.eq."{CURSOR_TS}",id.lt.{CURSOR_ID})'
+        )
+        query.lt.assert_not_called()
+        query.limit.assert_called_once_with(20)
+        query.range.assert_not_called()
+
+    def test_cursor_without_id_filters_on_timestamp(self):
+        ts = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        query = _get_user_sessions(after_updated_at=ts)
+
+        query.lt.assert_called_once_with("updated_at", CURSOR_TS)
+        query.or_.assert_not_called()
+
+    def test_no_cursor_uses_offset_range(self):
+        query = _get_user_sessions(limit=10, offset=30)
+
+        query.range.assert_called_once_with(30, 39)
+        query.or_.assert_not_called()
+        query.lt.assert_not_called()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Parameter validation (GET /api/v1/session/)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestListSessionsParams:
+    def _get(self, params: dict):
+        db = AsyncMock()
+        db.get_user_sessions.return_value = []
+        app.dependency_overrides[get_current_user_id] = lambda: "user-1"
+        try:
+            with patch("app.api.v1.session.supabase_service", db):
+                response = TestClient(app).get("/api/v1/session/", params=params)
+        finally:
+            app.dependency_overrides.pop(get_current_user_id, None)
+        return response, db
+
+    def test_valid_cursor_is_passed_as_uuid(self):
+        response, db = self._get({"after_updated_at": CURSOR_TS, "after_id": CURSOR_ID})
+
+        assert response.status_code == 200
+        assert db.get_user_sessions.await_args.kwargs["after_id"] == UUID(CURSOR_ID)
+
+    def test_non_uuid_after_id_is_rejected(self):
+        injected = '1),id.gt.0,and(id.eq.1'
+        response, db = self._get({"after_updated_at": CURSOR_TS, "after_id": injected})
+
+        assert response.status_code == 422
+        db.get_user_sessions.assert_not_awaited()
+
+    def test_after_id_without_timestamp_is_rejected(self):
+        response, db = self._get({"after_id": CURSOR_ID})
+
+        assert response.status_code == 422
+        db.get_user_sessions.assert_not_awaited()
+
+    def test_offset_with_cursor_is_rejected(self):
+        response, db = self._get({"after_updated_at": CURSOR_TS, "offset": 20})
+
+        assert response.status_code == 422
+        db.get_user_sessions.assert_not_awaited()
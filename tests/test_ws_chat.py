@@ -976,5 +976,129 @@ class TestConnectionIsolation:
                     assert "session_id" in msg_b
 
 
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Tests: Partial "message" streaming
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestPartialMessageStreaming:
+    """Decoding of the clarification JSON's "message" field as it streams."""
+
+    FULL = '{"message": "hi \\ud83d\\ude00 \\"x\\"", "form_fields": []}'
+
+    def _decode(self, buffer: str) -> tuple[str, bool]:
+        from app.api.v1.ws_chat import _partial_json_string, _MESSAGE_FIELD_RE
+        return _partial_json_string(buffer, _MESSAGE_FIELD_RE)
+
+    def test_every_prefix_decodes_to_a_prefix_of_the_message(self):
+        """No prefix yields a lone surrogate or text the final value won't have."""
+        final, closed = self._decode(self.FULL)
+        assert final == 'hi \U0001F600 "x"'
+        assert closed is True
+
+        for k in range(len(self.FULL)):
+            message, _ = self._decode(self.FULL[:k])
+            message.encode("utf-8")  # raises on a lone surrogate
+            assert final.startswith(message)
+
+    def test_split_surrogate_pair_waits_for_low_half(self):
+        """A chunk ending between the two halves of a pair stops before it."""
+        buffer = '{"message": "hi \\ud83d'
+        assert self._decode(buffer) == ("hi ", False)
+        assert self._decode(buffer + '\\ude00') == ("hi \U0001F600", False)
+
+    def test_closed_only_after_closing_quote(self):
+        assert self._decode('{"message": "Xin chao') == ("Xin chao", False)
+        assert self._decode('{"message": "Xin chao"') == ("Xin chao", True)
+
+    def test_missing_field_returns_empty(self):
+        assert self._decode('{"form_fields": [') == ("", False)
+
+    def test_flush_sends_only_new_text(self):
+        """_flush_partial_message sends the delta and returns what was sent."""
+        import asyncio
+        from app.api.v1.ws_chat import _flush_partial_message
+
+        ws = AsyncMock()
+        streamed = asyncio.run(_flush_partial_message(ws, '{"message": "Xin', ""))
+        assert streamed == "Xin"
+        streamed = asyncio.run(_flush_partial_message(ws, '{"message": "Xin chao', streamed))
+        assert streamed == "Xin chao"
+        # Nothing new decoded: no frame
+        asyncio.run(_flush_partial_message(ws, '{"message": "Xin chao\\', streamed))
+
+        sent = [c.args[0] for c in ws.send_json.await_args_list]
+        assert [m["content"] for m in sent] == ["Xin", " chao"]
+        assert all(m["type"] == "stream" and m["done"] is False for m in sent)
+
+    def _run_clarification(self, fake_stream) -> tuple[list[dict], AsyncMock]:
+        """Drive one CLARIFYING turn; return every stream frame and the db mock."""
+        from app.models.schemas import ExtractedAttributes
+        from app.models.enums import DesignType
+
+        attrs = ExtractedAttributes(
+            design_type=DesignType.COHORT_PROSPECTIVE,
+            population="Benh nhan dai thao duong",
+        )
+        db = _supabase_mock(session=_make_session(state="INITIAL"))
+        mock_llm = MagicMock()
+        mock_llm.stream = fake_stream
+
+        with (
+            patch("app.api.v1.ws_chat.supabase_service", db),
+            patch("app.api.v1.ws_chat.extract_attributes", return_value=attrs),
+            patch("app.api.v1.ws_chat.merge_attributes", return_value=attrs),
+            patch("app.api.v1.ws_chat.get_llm_client", return_value=mock_llm),
+            patch("app.api.v1.ws_chat.STREAM_FLUSH_INTERVAL", 0),
+            patch("app.api.v1.ws_chat.DEV_MODE", True),
+        ):
+            with TestClient(app).websocket_connect("/api/v1/ws/chat") as ws:
+                ws.receive_text()  # auth_success
+                ws.send_json({"type": "create_session"})
+                json.loads(ws.receive_text())
+
+                ws.send_json({"type": "chat", "message": "Toi muon nghien cuu gi do"})
+                frames = []
+                while True:
+                    msg = json.loads(ws.receive_text())
+                    assert msg["type"] == "stream"
+                    frames.append(msg)
+                    if msg["done"]:
+                        return frames, db
+
+    @staticmethod
+    def _saved_assistant_text(db) -> str:
+        calls = [c.kwargs for c in db.add_conversation_turn.call_args_list]
+        return [c["content"] for c in calls if c["role"] == "assistant"][-1]
+
+    def test_failure_mid_message_sends_replace_frame(self):
+        """Text streamed before a failure is replaced by the saved fallback."""
+        async def fake_stream(**_):
+            yield '{"message": "Ban co the cho biet'
+            raise RuntimeError("connection reset")
+
+        frames, db = self._run_clarification(fake_stream)
+        saved = self._saved_assistant_text(db)
+
+        assert frames[0]["content"] == "Ban co the cho biet"
+        replace = [f for f in frames if f.get("replace")]
+        assert len(replace) == 1
+        assert replace[0]["content"] == saved
+        assert saved != "Ban co the cho biet"
+
+    def test_failure_after_message_closed_keeps_streamed_text(self):
+        """A complete message survives a later failure; no replace frame."""
+        async def fake_stream(**_):
+            yield '{"message": "Ban co the cho biet them?", "form_fields": ['
+            raise RuntimeError("connection reset")
+
+        frames, db = self._run_clarification(fake_stream)
+
+        assert not any(f.get("replace") for f in frames)
+        streamed = "".join(f.get("content", "") for f in frames if not f["done"])
+        assert streamed == "Ban co the cho biet them?"
+        assert self._saved_assistant_text(db) == streamed
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])